@@ -741,6 +741,11 @@ class ConfigManager:
         elif not model_path.lower().endswith('.onnx'):
             errors.append(f"Piper instance '{instance_name}' model_path must be an ONNX file (.onnx extension)")
         
+        # Validate quantized model path if provided
+        quantized_model_path = config.get('quantized_model_path')
+        if quantized_model_path and not str(quantized_model_path).lower().endswith('.onnx'):
+            errors.append(f"Piper instance '{instance_name}' quantized_model_path must be an ONNX file (.onnx extension)")
+        
         # Validate output directory
         output_dir = config.get('output_dir', 'cache_data/tts')
         if not output_dir:
@@ -2,7 +2,7 @@
 
 import sqlite3
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from pathlib import Path
 
 from src.time_reclamation.infrastructure.database import get_database_manager
@@ -247,8 +247,33 @@ class YouTubeDatabase:
             limit: Maximum number of videos to return
             
         Returns:
-            List of unprocessed video dictionaries
+            List of unprocessed video dictionaries (empty if reading fails)
         """
+        try:
+            return list(self.iter_unprocessed_videos(limit))
+        except Exception:
+            # Already logged by the iterator; never hand back a partial list
+            return []
+    
+    def iter_unprocessed_videos(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over videos that haven't been processed by LLM yet.
+        
+        Rows are read from the cursor as they are consumed, so memory stays
+        bounded however many videos match. The connection stays open until
+        the iterator is exhausted or closed.
+        
+        Args:
+            limit: Maximum number of videos to yield
+            
+        Yields:
+            Unprocessed video dictionaries, oldest first
+            
+        Raises:
+            Exception: If reading fails after rows were already yielded, so a
+                truncated listing is not mistaken for a complete one
+        """
+        yielded = False
         try:
             with self.db_manager.get_connection() as conn:
                 query = """
@@ -262,12 +287,14 @@ class YouTubeDatabase:
                     query += " LIMIT ?"
                     params.append(limit)
                 
-                cursor = conn.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
+                for row in conn.execute(query, params):
+                    yielded = True
+                    yield dict(row)
                 
         except Exception as e:
             self.logger.error(f"Error getting unprocessed videos: {str(e)}")
-            return []
+            if yielded:
+                raise
     
     def get_database_stats(self) -> Dict[str, Any]:
         """
@@ -1,6 +1,7 @@
 """Main YouTube service orchestrating all YouTube functionality."""
 
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional
 
 from src.time_reclamation.infrastructure import get_logger
 from .channel_manager import YouTubeChannelManager, ChannelConfig
@@ -189,6 +190,18 @@ class YouTubeService:
         """
         return self.database.get_unprocessed_videos(limit)
     
+    def iter_unprocessed_videos(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over videos that haven't been processed by LLM yet, one row at a time.
+        
+        Args:
+            limit: Maximum number of videos to yield
+            
+        Yields:
+            Unprocessed video dictionaries
+        """
+        return self.database.iter_unprocessed_videos(limit)
+    
     def mark_video_processed(self, video_url: str, processed: bool = True) -> bool:
         """
         Mark a video as processed by LLM.
@@ -268,6 +281,28 @@ class YouTubeService:
             Dictionary containing cache statistics
         """
         return self.cache_manager.get_cache_stats()
+    
+    def get_all_stats(self) -> Dict[str, Any]:
+        """
+        Get database, channel and cache statistics in one call.
+        
+        The three lookups are independent and I/O bound (SQLite queries and
+        cache directory walks), so they run concurrently and the call takes
+        about as long as the slowest of them.
+        
+        Returns:
+            Dictionary with 'database', 'channels' and 'cache' statistics
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            database_future = executor.submit(self.get_database_stats)
+            channels_future = executor.submit(self.get_channel_stats)
+            cache_future = executor.submit(self.get_cache_stats)
+            
+            return {
+                'database': database_future.result(),
+                'channels': channels_future.result(),
+                'cache': cache_future.result(),
+            }
 
 
 # Global YouTube service instance
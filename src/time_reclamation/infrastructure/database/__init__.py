@@ -1,5 +1,5 @@
 """Database management module for Time Reclamation App."""
 
-from .manager import DatabaseManager, get_database_manager
+from .manager import DatabaseManager, get_database_manager, close_database_manager
 
-__all__ = ['DatabaseManager', 'get_database_manager']
\ No newline at end of file
+__all__ = ['DatabaseManager', 'get_database_manager', 'close_database_manager']
\ No newline at end of file
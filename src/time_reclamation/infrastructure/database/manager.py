@@ -2,6 +2,7 @@
 
 import os
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Optional
 from contextlib import contextmanager
@@ -22,6 +23,7 @@ class DatabaseManager:
         self.logger = get_logger()
         self.config = get_app_config()
         self.db_path = db_path or self.config.database.path
+        self._local = threading.local()  # Main thread's cached read-only connection
         self._ensure_database_directory()
     
     def _ensure_database_directory(self) -> None:
@@ -32,13 +34,34 @@ class DatabaseManager:
             self.logger.debug(f"Created database directory: {db_dir}")
     
     @contextmanager
-    def get_connection(self):
+    def get_connection(self, readonly: bool = False):
         """
         Get a database connection using context manager.
         
+        On the main thread the read-only connection is opened once and reused
+        across calls, so it is not closed when the context exits; the CLI
+        calls close() on shutdown. Other threads (e.g. short-lived pool
+        workers) get their own read-only connection that is closed on exit.
+        
+        Args:
+            readonly: Open the database read-only
+        
         Yields:
             sqlite3.Connection: Database connection
         """
+        if readonly:
+            shared = threading.current_thread() is threading.main_thread()
+            conn = self._get_readonly_connection() if shared else self._open_readonly_connection()
+            try:
+                yield conn
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error: {str(e)}")
+                raise
+            finally:
+                if not shared:
+                    conn.close()
+            return
+        
         conn = None
         try:
             conn = sqlite3.connect(self.db_path)
@@ -53,6 +76,38 @@ class DatabaseManager:
             if conn:
                 conn.close()
     
+    def _open_readonly_connection(self) -> sqlite3.Connection:
+        """
+        Open a new read-only connection to the database.
+        
+        Returns:
+            sqlite3.Connection: Read-only database connection
+        """
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        return conn
+    
+    def _get_readonly_connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's cached read-only connection, opening it on first use.
+        
+        Returns:
+            sqlite3.Connection: Read-only database connection
+        """
+        conn = getattr(self._local, 'readonly_conn', None)
+        if conn is None:
+            conn = self._open_readonly_connection()
+            self._local.readonly_conn = conn
+        return conn
+    
+    def close(self) -> None:
+        """Close the calling thread's cached read-only connection, if any."""
+        conn = getattr(self._local, 'readonly_conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.readonly_conn = None
+    
     def get_database_size_mb(self) -> float:
         """
         Get the database file size in megabytes.
@@ -136,7 +191,7 @@ class DatabaseManager:
         if info['exists']:
             try:
                 # Test read access
-                with self.get_connection() as conn:
+                with self.get_connection(readonly=True) as conn:
                     conn.execute("SELECT 1")
                     info['readable'] = True
                 
@@ -164,4 +219,12 @@ def get_database_manager() -> DatabaseManager:
     global _database_manager
     if _database_manager is None:
         _database_manager = DatabaseManager()
-    return _database_manager
\ No newline at end of file
+    return _database_manager
+
+
+def close_database_manager() -> None:
+    """
+    Close the global database manager's cached connection, if it was ever created.
+    """
+    if _database_manager is not None:
+        _database_manager.close()
\ No newline at end of file
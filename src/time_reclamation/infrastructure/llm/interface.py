@@ -6,7 +6,7 @@ allowing easy switching between different language model services.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass
 from enum import Enum
 
@@ -38,13 +38,16 @@ class LLMProvider(ABC):
     """
     
     @abstractmethod
-    def generate(self, system_prompt: str, user_prompt: str, **kwargs) -> LLMResult:
+    def generate(self, system_prompt: str, user_prompt: str,
+                 on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> LLMResult:
         """
         Generate a response using the LLM.
         
         Args:
             system_prompt: The system prompt to set context/behavior
             user_prompt: The user's input prompt
+            on_chunk: Called with each piece of text as it is generated (optional);
+                when given, the response is streamed from the provider
             **kwargs: Provider-specific parameters
             
         Returns:
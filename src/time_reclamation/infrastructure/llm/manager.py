@@ -5,7 +5,9 @@ This module provides a high-level interface for generating responses
 through various LLM providers with automatic provider selection and fallback.
 """
 
-from typing import Optional, List, Dict, Any
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Callable
 from .interface import LLMProvider, LLMResult, LLMStatus
 from .providers.llamacpp import LlamaCppProvider
 from .providers.anthropic import AnthropicProvider
@@ -15,6 +17,39 @@ from src.time_reclamation.config import get_config_manager
 from src.time_reclamation.infrastructure import get_logger
 
 
+# Prompt marshaling: several prompts are packed into one request as numbered rows
+_MAX_MARSHAL_ROWS = 8
+_ROW_HEADER_PATTERN = re.compile(r'^#{2,}\s*Row\s+(\d+)\s*:?[ \t]*', re.MULTILINE | re.IGNORECASE)
+_MARSHAL_INSTRUCTIONS = (
+    "You will receive several independent requests, each introduced by a header "
+    "of the form '### Row N:'. Answer every request separately and in order. "
+    "Begin each answer with the same '### Row N:' header as its request and "
+    "write nothing outside the answers."
+)
+
+
+def _split_marshaled_response(response: str, row_count: int) -> Optional[List[str]]:
+    """
+    Split a marshaled response back into per-row answers.
+    
+    Args:
+        response: Raw response text from the model
+        row_count: Number of rows that were sent
+        
+    Returns:
+        Optional[List[str]]: Answers in row order, or None if the response doesn't have exactly one answer per row
+    """
+    matches = list(_ROW_HEADER_PATTERN.finditer(response))
+    if [int(match.group(1)) for match in matches] != list(range(1, row_count + 1)):
+        return None
+    
+    answers = []
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(response)
+        answers.append(response[match.end():end].strip())
+    return answers
+
+
 class LLMManager:
     """
     High-level LLM manager that handles multiple providers.
@@ -28,6 +63,7 @@ class LLMManager:
         self.logger = get_logger()
         self._providers: Dict[str, LLMProvider] = {}  # keyed by instance name
         self._provider_instances: Dict[str, Dict[str, Any]] = {}  # metadata about instances
+        self._status_cache: Optional[Dict[str, Dict[str, Any]]] = None  # provider status snapshot (built on first use)
         self._initialize_providers()
     
     def _initialize_providers(self) -> None:
@@ -161,12 +197,104 @@ class LLMManager:
         result = provider.generate(system_prompt or "", user_prompt, **kwargs)
         
         if result.status == LLMStatus.SUCCESS:
-            self.logger.info(f"Response generated successfully via {provider.provider_name}")
+            # Streamed text is already on screen; keep the completion note out of it
+            log = self.logger.debug if kwargs.get('on_chunk') else self.logger.info
+            log(f"Response generated successfully via {provider.provider_name}")
         else:
             self.logger.error(f"Failed to generate response via {provider.provider_name}: {result.error_details}")
         
         return result
     
+    def generate_stream(self, user_prompt: str, on_chunk: Callable[[str], None],
+                        instance_name: Optional[str] = None,
+                        system_prompt: Optional[str] = None, **kwargs) -> LLMResult:
+        """
+        Generate a response, passing each piece of text to a callback as it arrives.
+        
+        Args:
+            user_prompt: The user's input prompt
+            on_chunk: Called with each chunk of generated text
+            instance_name: Specific provider instance to use (optional, will auto-select if not provided)
+            system_prompt: System prompt to set context/behavior (optional)
+            **kwargs: Provider-specific parameters
+            
+        Returns:
+            LLMResult: Result of the generation attempt
+        """
+        return self.generate_response(user_prompt, instance_name, system_prompt, on_chunk=on_chunk, **kwargs)
+    
+    def generate_batch(self, user_prompts: List[str], instance_name: Optional[str] = None,
+                       system_prompt: Optional[str] = None, max_marshal: int = _MAX_MARSHAL_ROWS,
+                       **kwargs) -> List[LLMResult]:
+        """
+        Generate responses for several prompts with as few requests as possible.
+        
+        Prompts are marshaled into requests of up to max_marshal numbered rows and
+        the response is split back per row. If a response can't be split cleanly,
+        that group's prompts are sent individually and concurrently instead.
+        
+        Args:
+            user_prompts: The user prompts to answer
+            instance_name: Specific provider instance to use (optional, will auto-select if not provided)
+            system_prompt: System prompt to set context/behavior (optional)
+            max_marshal: Maximum number of prompts packed into one request
+            **kwargs: Provider-specific parameters
+            
+        Returns:
+            List[LLMResult]: One result per prompt, in order
+        """
+        results = []
+        group_size = max(1, max_marshal)
+        for start in range(0, len(user_prompts), group_size):
+            group = user_prompts[start:start + group_size]
+            results.extend(self._generate_marshaled(group, instance_name, system_prompt, **kwargs))
+        return results
+    
+    def _generate_marshaled(self, user_prompts: List[str], instance_name: Optional[str],
+                            system_prompt: Optional[str], **kwargs) -> List[LLMResult]:
+        """
+        Answer a group of prompts with a single marshaled request.
+        
+        Args:
+            user_prompts: The user prompts to answer
+            instance_name: Specific provider instance to use (optional)
+            system_prompt: System prompt to set context/behavior (optional)
+            **kwargs: Provider-specific parameters
+            
+        Returns:
+            List[LLMResult]: One result per prompt, in order
+        """
+        if len(user_prompts) == 1:
+            return [self.generate_response(user_prompts[0], instance_name, system_prompt, **kwargs)]
+        
+        marshaled_prompt = "\n\n".join(
+            f"### Row {index}:\n{prompt}" for index, prompt in enumerate(user_prompts, 1)
+        )
+        marshaled_system = f"{system_prompt}\n\n{_MARSHAL_INSTRUCTIONS}" if system_prompt else _MARSHAL_INSTRUCTIONS
+        result = self.generate_response(marshaled_prompt, instance_name, marshaled_system, **kwargs)
+        
+        if result.status != LLMStatus.SUCCESS:
+            return [result] * len(user_prompts)
+        
+        answers = _split_marshaled_response(result.response or "", len(user_prompts))
+        if answers is None:
+            self.logger.warning("Could not split marshaled response, answering prompts individually")
+            with ThreadPoolExecutor(max_workers=len(user_prompts)) as executor:
+                return list(executor.map(
+                    lambda prompt: self.generate_response(prompt, instance_name, system_prompt, **kwargs),
+                    user_prompts
+                ))
+        
+        return [
+            LLMResult(
+                status=LLMStatus.SUCCESS,
+                response=answer,
+                provider_response=result.provider_response,
+                generation_time=result.generation_time
+            )
+            for answer in answers
+        ]
+    
     def generate_llamacpp_response(self, user_prompt: str, instance_name: Optional[str] = None, 
                                   system_prompt: Optional[str] = None, **kwargs) -> LLMResult:
         """
@@ -196,40 +324,61 @@ class LLMManager:
         
         return self.generate_response(user_prompt, instance_name, system_prompt, **kwargs)
     
-    def test_providers(self, instance_name: Optional[str] = None) -> Dict[str, LLMResult]:
+    def test_providers(self, instance_name: Optional[str] = None,
+                       on_result: Optional[Callable[[str, LLMResult], None]] = None) -> Dict[str, LLMResult]:
         """
         Test LLM provider instances.
         
+        Connection tests are network bound, so instances are tested concurrently.
+        
         Args:
             instance_name: Specific instance to test (optional, tests all if not provided)
+            on_result: Called with (instance_name, result) as each test completes (optional)
         
         Returns:
-            Dict[str, LLMResult]: Test results for each instance
+            Dict[str, LLMResult]: Test results for each instance, in configuration order
         """
+        instances_to_test = [instance_name] if instance_name else list(self._providers.keys())
+        if not instances_to_test:
+            return {}
+        
         results = {}
+        with ThreadPoolExecutor(max_workers=min(32, len(instances_to_test))) as executor:
+            futures = {executor.submit(self._test_provider, name): name for name in instances_to_test}
+            for future in as_completed(futures):
+                name = futures[future]
+                results[name] = future.result()
+                if on_result:
+                    on_result(name, results[name])
         
-        instances_to_test = [instance_name] if instance_name else list(self._providers.keys())
+        return {name: results[name] for name in instances_to_test}
+    
+    def _test_provider(self, name: str) -> LLMResult:
+        """
+        Test a single LLM provider instance.
         
-        for name in instances_to_test:
-            if name not in self._providers:
-                results[name] = LLMResult(
-                    status=LLMStatus.FAILED,
-                    error_details=f"LLM provider instance '{name}' not found"
-                )
-                continue
-                
-            provider = self._providers[name]
-            self.logger.info(f"Testing {provider.provider_name} provider...")
-            
-            if not provider.is_configured():
-                results[name] = LLMResult(
-                    status=LLMStatus.FAILED,
-                    error_details=f"{provider.provider_name} provider is not configured"
-                )
-            else:
-                results[name] = provider.test_connection()
+        Args:
+            name: Name of the instance to test
         
-        return results
+        Returns:
+            LLMResult: Test result for the instance
+        """
+        if name not in self._providers:
+            return LLMResult(
+                status=LLMStatus.FAILED,
+                error_details=f"LLM provider instance '{name}' not found"
+            )
+        
+        provider = self._providers[name]
+        self.logger.info(f"Testing {provider.provider_name} provider...")
+        
+        if not provider.is_configured():
+            return LLMResult(
+                status=LLMStatus.FAILED,
+                error_details=f"{provider.provider_name} provider is not configured"
+            )
+        
+        return provider.test_connection()
     
     def is_any_provider_configured(self) -> bool:
         """
@@ -238,16 +387,26 @@ class LLMManager:
         Returns:
             bool: True if at least one provider instance is configured
         """
-        return len(self.get_available_instances()) > 0
+        return any(status['available'] for status in self.get_provider_status().values())
     
-    def get_provider_status(self) -> Dict[str, Dict[str, Any]]:
+    def get_provider_status(self, cached: bool = True) -> Dict[str, Dict[str, Any]]:
         """
         Get status information for all provider instances.
         
+        Providers are fixed for the lifetime of the manager (configuration
+        changes build a new one), so the snapshot is computed once and reused.
+        
+        Args:
+            cached: Return the last snapshot if there is one (default True)
+        
         Returns:
             Dict[str, Dict[str, Any]]: Status information for each instance
         """
+        if cached and self._status_cache is not None:
+            return self._status_cache
+        
         status = {}
+        available = set(self.get_available_instances())
         
         for instance_name, provider in self._providers.items():
             metadata = self._provider_instances.get(instance_name, {})
@@ -255,15 +414,17 @@ class LLMManager:
                 'name': provider.provider_name,
                 'type': metadata.get('type', 'unknown'),
                 'configured': provider.is_configured(),
-                'available': instance_name in self.get_available_instances()
+                'available': instance_name in available
             }
         
+        self._status_cache = status
         return status
     
     def cleanup_all(self) -> None:
         """
         Clean up all provider resources.
         """
+        self._status_cache = None
         for provider in self._providers.values():
             try:
                 provider.cleanup()
@@ -6,7 +6,7 @@ official anthropic Python library for Claude models.
 """
 
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from ..interface import LLMProvider, LLMResult, LLMStatus
 from src.time_reclamation.config import get_config_manager
 from src.time_reclamation.infrastructure import get_logger
@@ -127,13 +127,15 @@ class AnthropicProvider(LLMProvider):
             remaining_seconds = seconds % 60
             return f"{hours}h {remaining_minutes}m {remaining_seconds:.1f}s"
     
-    def generate(self, system_prompt: str, user_prompt: str, **kwargs) -> LLMResult:
+    def generate(self, system_prompt: str, user_prompt: str,
+                 on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> LLMResult:
         """
         Generate a response using the Anthropic Claude model.
         
         Args:
             system_prompt: The system prompt to set context/behavior
             user_prompt: The user's input prompt
+            on_chunk: Called with each piece of text as it arrives (optional, enables streaming)
             **kwargs: Additional generation parameters
             
         Returns:
@@ -182,14 +184,27 @@ class AnthropicProvider(LLMProvider):
             self.logger.debug("Generating response via Anthropic API...")
             generation_start = time.time()
             
-            response = self._client.messages.create(
-                model=self.model,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ],
-                **generation_params
-            )
+            if on_chunk is not None:
+                with self._client.messages.stream(
+                    model=self.model,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    **generation_params
+                ) as stream:
+                    for text in stream.text_stream:
+                        on_chunk(text)
+                    response = stream.get_final_message()
+            else:
+                response = self._client.messages.create(
+                    model=self.model,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    **generation_params
+                )
             
             generation_end = time.time()
             
@@ -7,7 +7,7 @@ llama-cpp-python library, adapted for the TimeReclamation project.
 
 import os
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from ..interface import LLMProvider, LLMResult, LLMStatus
 from src.time_reclamation.config import get_config_manager
 from src.time_reclamation.infrastructure import get_logger
@@ -161,13 +161,15 @@ class LlamaCppProvider(LLMProvider):
             remaining_seconds = seconds % 60
             return f"{hours}h {remaining_minutes}m {remaining_seconds:.1f}s"
     
-    def generate(self, system_prompt: str, user_prompt: str, **kwargs) -> LLMResult:
+    def generate(self, system_prompt: str, user_prompt: str,
+                 on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> LLMResult:
         """
         Generate a response using the LlamaCpp model.
         
         Args:
             system_prompt: The system prompt to set context/behavior
             user_prompt: The user's input prompt
+            on_chunk: Called with each piece of text as it arrives (optional, enables streaming)
             **kwargs: Additional generation parameters
             
         Returns:
@@ -224,15 +226,37 @@ class LlamaCppProvider(LLMProvider):
             # Generate response
             self.logger.debug("Generating response...")
             generation_start = time.time()
-            response = self._llm_model(
-                formatted_prompt,
-                **generation_params
-            )
+            if on_chunk is not None:
+                parts = []
+                finish_reason = None
+                for chunk in self._llm_model(
+                    formatted_prompt,
+                    stream=True,
+                    **generation_params
+                ):
+                    choice = chunk['choices'][0]
+                    finish_reason = choice.get('finish_reason') or finish_reason
+                    text = choice['text']
+                    if text:
+                        parts.append(text)
+                        on_chunk(text)
+                generated_text = "".join(parts).strip()
+                
+                # A stream has no single completion object; assemble one from the chunks
+                response = {
+                    'object': 'text_completion',
+                    'choices': [{'text': generated_text, 'finish_reason': finish_reason}],
+                }
+            else:
+                response = self._llm_model(
+                    formatted_prompt,
+                    **generation_params
+                )
+                
+                # Extract the generated text
+                generated_text = response['choices'][0]['text'].strip()
             generation_end = time.time()
             
-            # Extract the generated text
-            generated_text = response['choices'][0]['text'].strip()
-            
             end_time = time.time()
             total_time = end_time - start_time
             generation_time = generation_end - generation_start
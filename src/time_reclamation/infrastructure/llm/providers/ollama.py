@@ -6,7 +6,7 @@ official ollama Python library for local and remote Ollama instances.
 """
 
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from ..interface import LLMProvider, LLMResult, LLMStatus
 from src.time_reclamation.config import get_config_manager
 from src.time_reclamation.infrastructure import get_logger
@@ -126,13 +126,15 @@ class OllamaProvider(LLMProvider):
             remaining_seconds = seconds % 60
             return f"{hours}h {remaining_minutes}m {remaining_seconds:.1f}s"
     
-    def generate(self, system_prompt: str, user_prompt: str, **kwargs) -> LLMResult:
+    def generate(self, system_prompt: str, user_prompt: str,
+                 on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> LLMResult:
         """
         Generate a response using the Ollama model.
         
         Args:
             system_prompt: The system prompt to set context/behavior
             user_prompt: The user's input prompt
+            on_chunk: Called with each piece of text as it arrives (optional, enables streaming)
             **kwargs: Additional generation parameters
             
         Returns:
@@ -194,18 +196,35 @@ class OllamaProvider(LLMProvider):
             self.logger.debug(f"Generating response via Ollama API at {self.base_url}...")
             generation_start = time.time()
             
-            response = self._client.chat(
-                model=self.model,
-                messages=messages,
-                options=generation_params,
-                stream=False
-            )
+            if on_chunk is not None:
+                # Forward chunks as they arrive; the final chunk carries the eval stats
+                parts = []
+                response = {}  # stays empty if the stream yields nothing
+                for chunk in self._client.chat(
+                    model=self.model,
+                    messages=messages,
+                    options=generation_params,
+                    stream=True
+                ):
+                    response = chunk
+                    text = chunk['message']['content']
+                    if text:
+                        parts.append(text)
+                        on_chunk(text)
+                generated_text = "".join(parts)
+            else:
+                response = self._client.chat(
+                    model=self.model,
+                    messages=messages,
+                    options=generation_params,
+                    stream=False
+                )
+                
+                # Extract the generated text
+                generated_text = response['message']['content']
             
             generation_end = time.time()
             
-            # Extract the generated text
-            generated_text = response['message']['content']
-            
             end_time = time.time()
             total_time = end_time - start_time
             generation_time = generation_end - generation_start
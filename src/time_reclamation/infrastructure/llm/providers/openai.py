@@ -6,7 +6,7 @@ official openai Python library for GPT models.
 """
 
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from ..interface import LLMProvider, LLMResult, LLMStatus
 from src.time_reclamation.config import get_config_manager
 from src.time_reclamation.infrastructure import get_logger
@@ -127,13 +127,15 @@ class OpenAIProvider(LLMProvider):
             remaining_seconds = seconds % 60
             return f"{hours}h {remaining_minutes}m {remaining_seconds:.1f}s"
     
-    def generate(self, system_prompt: str, user_prompt: str, **kwargs) -> LLMResult:
+    def generate(self, system_prompt: str, user_prompt: str,
+                 on_chunk: Optional[Callable[[str], None]] = None, **kwargs) -> LLMResult:
         """
         Generate a response using the OpenAI GPT model.
         
         Args:
             system_prompt: The system prompt to set context/behavior
             user_prompt: The user's input prompt
+            on_chunk: Called with each piece of text as it arrives (optional, enables streaming)
             **kwargs: Additional generation parameters
             
         Returns:
@@ -193,17 +195,45 @@ class OpenAIProvider(LLMProvider):
             self.logger.debug("Generating response via OpenAI API...")
             generation_start = time.time()
             
-            response = self._client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                **generation_params
-            )
+            if on_chunk is not None:
+                parts = []
+                usage = None
+                for chunk in self._client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **generation_params
+                ):
+                    # Usage arrives on the final chunk, which has no choices
+                    if getattr(chunk, 'usage', None):
+                        usage = chunk.usage
+                    text = chunk.choices[0].delta.content if chunk.choices else None
+                    if text:
+                        parts.append(text)
+                        on_chunk(text)
+                generated_text = "".join(parts)
+                
+                # A stream has no single completion object; report what was assembled
+                provider_response = {
+                    "model": self.model,
+                    "content": generated_text,
+                    "usage": usage.model_dump() if hasattr(usage, 'model_dump') else None,
+                }
+            else:
+                response = self._client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    **generation_params
+                )
+                
+                # Extract the generated text
+                generated_text = response.choices[0].message.content
+                usage = getattr(response, 'usage', None)
+                provider_response = response.model_dump() if hasattr(response, 'model_dump') else None
             
             generation_end = time.time()
             
-            # Extract the generated text
-            generated_text = response.choices[0].message.content
-            
             end_time = time.time()
             total_time = end_time - start_time
             generation_time = generation_end - generation_start
@@ -212,15 +242,15 @@ class OpenAIProvider(LLMProvider):
             
             # Extract token count if available
             token_count = None
-            if hasattr(response, 'usage') and response.usage:
-                token_count = response.usage.completion_tokens
+            if usage:
+                token_count = usage.completion_tokens
             
             return LLMResult(
                 status=LLMStatus.SUCCESS,
                 response=generated_text,
                 generation_time=generation_time,
                 token_count=token_count,
-                provider_response=response.model_dump() if hasattr(response, 'model_dump') else None
+                provider_response=provider_response
             )
             
         except Exception as e:
@@ -4,7 +4,8 @@ import logging
 import sys
 import os
 import yaml
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 from enum import Enum
 
 
@@ -57,6 +58,7 @@ class ConsoleLogger:
         self.name = name
         self.use_colors = use_colors and sys.stdout.isatty()
         self.logger = logging.getLogger(name)
+        self._buffer: Optional[List[str]] = None  # pending output while buffered() is active
         
         # Set up basic logging configuration if not already configured
         if not self.logger.handlers:
@@ -66,25 +68,30 @@ class ConsoleLogger:
             self.logger.addHandler(handler)
             self.logger.setLevel(logging.INFO)
     
-    def debug(self, message: str) -> None:
-        """Log debug message."""
-        self.logger.debug(message)
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether debug messages are currently emitted."""
+        return self.logger.isEnabledFor(logging.DEBUG)
     
-    def info(self, message: str) -> None:
-        """Log info message."""
-        self.logger.info(message)
+    def debug(self, message: str, *args) -> None:
+        """Log debug message (printf-style args are formatted lazily)."""
+        self.logger.debug(message, *args)
     
-    def warning(self, message: str) -> None:
-        """Log warning message."""
-        self.logger.warning(message)
+    def info(self, message: str, *args) -> None:
+        """Log info message (printf-style args are formatted lazily)."""
+        self.logger.info(message, *args)
     
-    def error(self, message: str) -> None:
-        """Log error message."""
-        self.logger.error(message)
+    def warning(self, message: str, *args) -> None:
+        """Log warning message (printf-style args are formatted lazily)."""
+        self.logger.warning(message, *args)
     
-    def critical(self, message: str) -> None:
-        """Log critical message."""
-        self.logger.critical(message)
+    def error(self, message: str, *args) -> None:
+        """Log error message (printf-style args are formatted lazily)."""
+        self.logger.error(message, *args)
+    
+    def critical(self, message: str, *args) -> None:
+        """Log critical message (printf-style args are formatted lazily)."""
+        self.logger.critical(message, *args)
     
     def success(self, message: str) -> None:
         """Log success message (info level with green color)."""
@@ -98,28 +105,92 @@ class ConsoleLogger:
         """Print a formatted header."""
         border = "=" * width
         if self.use_colors:
-            print(f"{Colors.BOLD}{Colors.CYAN}{border}{Colors.RESET}")
-            print(f"{Colors.BOLD}{Colors.CYAN}{title.center(width)}{Colors.RESET}")
-            print(f"{Colors.BOLD}{Colors.CYAN}{border}{Colors.RESET}")
+            self._print_lines((
+                f"{Colors.BOLD}{Colors.CYAN}{border}{Colors.RESET}",
+                f"{Colors.BOLD}{Colors.CYAN}{title.center(width)}{Colors.RESET}",
+                f"{Colors.BOLD}{Colors.CYAN}{border}{Colors.RESET}",
+            ))
         else:
-            print(border)
-            print(title.center(width))
-            print(border)
+            self._print_lines((border, title.center(width), border))
     
-    def print_section(self, title: str) -> None:
-        """Print a section header."""
+    def format_section(self, title: str) -> str:
+        """Format a section header (including its leading blank line)."""
         if self.use_colors:
-            print(f"\n{Colors.BOLD}{Colors.YELLOW}{title}:{Colors.RESET}")
-        else:
-            print(f"\n{title}:")
+            return f"\n{Colors.BOLD}{Colors.YELLOW}{title}:{Colors.RESET}"
+        return f"\n{title}:"
     
-    def print_bullet(self, text: str, indent: int = 2) -> None:
-        """Print a bullet point."""
+    def format_bullet(self, text: str, indent: int = 2) -> str:
+        """Format a bullet point."""
         spaces = " " * indent
         if self.use_colors:
-            print(f"{spaces}{Colors.BRIGHT_BLUE}•{Colors.RESET} {text}")
+            return f"{spaces}{Colors.BRIGHT_BLUE}•{Colors.RESET} {text}"
+        return f"{spaces}• {text}"
+    
+    def render_sections(self, sections: Sequence[Tuple[str, Sequence[str]]]) -> str:
+        """
+        Render titled bullet sections into a single block of text.
+        
+        Args:
+            sections: (title, bullets) pairs
+            
+        Returns:
+            str: The rendered text, ending with a newline
+        """
+        lines = []
+        for title, bullets in sections:
+            lines.append(self.format_section(title))
+            lines.extend(self.format_bullet(bullet) for bullet in bullets)
+        return "\n".join(lines) + "\n"
+    
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """
+        Collect printed headers, sections and bullets and write them in one call.
+        
+        Log records are not buffered, so only wrap pure rendering code.
+        Nested blocks join the outermost one.
+        """
+        if self._buffer is not None:
+            yield
+            return
+        
+        self._buffer = []
+        try:
+            yield
+        finally:
+            pending, self._buffer = self._buffer, None
+            if pending:
+                self.print_block("".join(pending))
+    
+    def print_block(self, text: str) -> None:
+        """Write pre-rendered text to stdout in a single call."""
+        if self._buffer is not None:
+            self._buffer.append(text)
+            return
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    
+    def _print_lines(self, lines: Sequence[str]) -> None:
+        """Print lines with a single write, or hold them while buffered."""
+        text = "\n".join(lines)
+        if self._buffer is not None:
+            self._buffer.append(text + "\n")
         else:
-            print(f"{spaces}• {text}")
+            print(text)
+    
+    def print_section(self, title: str) -> None:
+        """Print a section header."""
+        self._print_lines((self.format_section(title),))
+    
+    def print_bullet(self, text: str, indent: int = 2) -> None:
+        """Print a bullet point."""
+        self._print_lines((self.format_bullet(text, indent),))
+    
+    def print_bullets(self, texts: Iterable[str], indent: int = 2) -> None:
+        """Print several bullet points with a single write."""
+        lines = [self.format_bullet(text, indent) for text in texts]
+        if lines:
+            self._print_lines(lines)
     
     def print_command(self, command: str, description: str) -> None:
         """Print a command with its description."""
@@ -149,6 +220,16 @@ class ConsoleLogger:
             self.logger.setLevel(level_map[level.upper()])
         else:
             self.warning(f"Unknown log level: {level}")
+    
+    @contextmanager
+    def temporary_level(self, level: str) -> Iterator[None]:
+        """Set the logging level for the duration of the block, then restore the previous one."""
+        previous = self.logger.level
+        self.set_level(level)
+        try:
+            yield
+        finally:
+            self.logger.setLevel(previous)
 
 
 # Global logger instance
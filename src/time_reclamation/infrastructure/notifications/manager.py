@@ -5,7 +5,8 @@ This module provides a high-level interface for sending notifications
 through various providers with automatic provider selection and fallback.
 """
 
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Callable
 from enum import Enum
 from .interface import NotificationProvider, NotificationResult, NotificationStatus
 from .providers.telegram import TelegramProvider
@@ -29,6 +30,8 @@ class NotificationManager:
         self.logger = get_logger()
         self._providers: Dict[str, NotificationProvider] = {}  # keyed by instance name
         self._provider_instances: Dict[str, Dict[str, Any]] = {}  # metadata about instances
+        self._executor: Optional[ThreadPoolExecutor] = None  # shared pool for concurrent sends/tests (lazy created)
+        self._status_cache: Optional[Dict[str, Dict[str, Any]]] = None  # provider status snapshot (built on first use)
         self._initialize_providers()
     
     def _initialize_providers(self) -> None:
@@ -70,6 +73,20 @@ class NotificationManager:
         except Exception as e:
             self.logger.error(f"Failed to initialize providers: {str(e)}")
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool used for concurrent provider calls.
+        
+        Provider calls are network bound, so one pool is shared across
+        connection tests and broadcasts to avoid restarting threads.
+        
+        Returns:
+            ThreadPoolExecutor: The shared executor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="notify")
+        return self._executor
+    
     def get_available_instances(self) -> List[str]:
         """
         Get list of available and configured provider instances.
@@ -183,42 +200,112 @@ class NotificationManager:
                     error_details="No configured Telegram instances available"
                 )
         
-        return self.send_message(message, instance_name, **kwargs)
+        return self.send_message(message, instance_name=instance_name, **kwargs)
     
-    def test_providers(self, instance_name: Optional[str] = None) -> Dict[str, NotificationResult]:
+    def test_providers(self, instance_name: Optional[str] = None,
+                       on_result: Optional[Callable[[str, NotificationResult], None]] = None) -> Dict[str, NotificationResult]:
         """
         Test provider instances.
         
+        Connection tests are network bound, so instances are tested concurrently.
+        
         Args:
             instance_name: Specific instance to test (optional, tests all if not provided)
+            on_result: Called with (instance_name, result) as each test completes (optional)
         
         Returns:
-            Dict[str, NotificationResult]: Test results for each instance
+            Dict[str, NotificationResult]: Test results for each instance, in configuration order
         """
+        instances_to_test = [instance_name] if instance_name else list(self._providers.keys())
+        if not instances_to_test:
+            return {}
+        
         results = {}
+        executor = self._get_executor()
+        futures = {executor.submit(self._test_provider, name): name for name in instances_to_test}
+        for future in as_completed(futures):
+            name = futures[future]
+            results[name] = future.result()
+            if on_result:
+                on_result(name, results[name])
         
-        instances_to_test = [instance_name] if instance_name else list(self._providers.keys())
+        return {name: results[name] for name in instances_to_test}
+    
+    def test_and_send(self, message: str, instance_name: Optional[str] = None, send_all: bool = False,
+                      on_test_result: Optional[Callable[[str, NotificationResult], None]] = None,
+                      on_send_result: Optional[Callable[[str, NotificationResult], None]] = None,
+                      **kwargs) -> Dict[str, NotificationResult]:
+        """
+        Test provider instances and send a message in a single concurrent pass.
         
-        for name in instances_to_test:
-            if name not in self._providers:
-                results[name] = NotificationResult(
-                    status=NotificationStatus.FAILED,
-                    error_details=f"Provider instance '{name}' not found"
-                )
-                continue
-                
-            provider = self._providers[name]
-            self.logger.info(f"Testing {provider.provider_name} provider...")
-            
-            if not provider.is_configured():
-                results[name] = NotificationResult(
-                    status=NotificationStatus.FAILED,
-                    error_details=f"{provider.provider_name} provider is not configured"
-                )
-            else:
-                results[name] = provider.test_connection()
+        A successful send proves the connection, so instances that receive the
+        message are not tested separately; the remaining instances are tested
+        alongside the sends.
+        
+        Args:
+            message: The message text to send
+            instance_name: Only send through (and check) this instance (optional)
+            send_all: Send through every configured instance instead of the first one
+            on_test_result: Called with (instance_name, result) as each connection test completes (optional)
+            on_send_result: Called with (instance_name, result) as each send completes (optional)
+            **kwargs: Provider-specific parameters
+        
+        Returns:
+            Dict[str, NotificationResult]: Send results for the instances that received the
+            message, followed by test results for the others
+        """
+        if instance_name is not None:
+            senders = [instance_name]
+            testers = []
+        else:
+            available = self.get_available_instances()
+            senders = available if send_all else available[:1]
+            testers = [name for name in self._providers if name not in senders]
+        
+        results = {}
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self.send_message, message, instance_name=name, **kwargs): (name, on_send_result)
+            for name in senders
+        }
+        futures.update({
+            executor.submit(self._test_provider, name): (name, on_test_result)
+            for name in testers
+        })
+        for future in as_completed(futures):
+            name, callback = futures[future]
+            results[name] = future.result()
+            if callback:
+                callback(name, results[name])
         
-        return results
+        return {name: results[name] for name in senders + testers}
+    
+    def _test_provider(self, name: str) -> NotificationResult:
+        """
+        Test a single provider instance.
+        
+        Args:
+            name: Name of the instance to test
+        
+        Returns:
+            NotificationResult: Test result for the instance
+        """
+        if name not in self._providers:
+            return NotificationResult(
+                status=NotificationStatus.FAILED,
+                error_details=f"Provider instance '{name}' not found"
+            )
+        
+        provider = self._providers[name]
+        self.logger.info(f"Testing {provider.provider_name} provider...")
+        
+        if not provider.is_configured():
+            return NotificationResult(
+                status=NotificationStatus.FAILED,
+                error_details=f"{provider.provider_name} provider is not configured"
+            )
+        
+        return provider.test_connection()
     
     def is_any_provider_configured(self) -> bool:
         """
@@ -227,16 +314,26 @@ class NotificationManager:
         Returns:
             bool: True if at least one provider instance is configured
         """
-        return len(self.get_available_instances()) > 0
+        return any(status['available'] for status in self.get_provider_status().values())
     
-    def get_provider_status(self) -> Dict[str, Dict[str, Any]]:
+    def get_provider_status(self, cached: bool = True) -> Dict[str, Dict[str, Any]]:
         """
         Get status information for all provider instances.
         
+        Providers are fixed for the lifetime of the manager (configuration
+        changes build a new one), so the snapshot is computed once and reused.
+        
+        Args:
+            cached: Return the last snapshot if there is one (default True)
+        
         Returns:
             Dict[str, Dict[str, Any]]: Status information for each instance
         """
+        if cached and self._status_cache is not None:
+            return self._status_cache
+        
         status = {}
+        available = set(self.get_available_instances())
         
         for instance_name, provider in self._providers.items():
             metadata = self._provider_instances.get(instance_name, {})
@@ -244,9 +341,10 @@ class NotificationManager:
                 'name': provider.provider_name,
                 'type': metadata.get('type', 'unknown'),
                 'configured': provider.is_configured(),
-                'available': instance_name in self.get_available_instances()
+                'available': instance_name in available
             }
         
+        self._status_cache = status
         return status
 
 
@@ -279,4 +377,4 @@ def send_notification(message: str, instance_name: Optional[str] = None, **kwarg
     Returns:
         NotificationResult: Result of the notification attempt
     """
-    return get_notification_manager().send_message(message, instance_name, **kwargs)
\ No newline at end of file
+    return get_notification_manager().send_message(message, instance_name=instance_name, **kwargs)
\ No newline at end of file
@@ -1,9 +1,10 @@
 """TTS infrastructure package."""
 
-from .interface import TTSProvider, TTSResult, TTSStatus
+from .interface import ProviderStatus, TTSProvider, TTSResult, TTSStatus
 from .manager import TTSManager, get_tts_manager, generate_speech
 
 __all__ = [
+    'ProviderStatus',
     'TTSProvider',
     'TTSResult',
     'TTSStatus',
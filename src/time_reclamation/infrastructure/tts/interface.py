@@ -29,6 +29,15 @@ class TTSResult:
     provider_response: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class ProviderStatus:
+    """Status of a configured TTS provider instance."""
+    name: str
+    type: str
+    configured: bool
+    available: bool
+
+
 class TTSProvider(ABC):
     """
     Abstract base class for TTS providers.
@@ -37,6 +46,8 @@ class TTSProvider(ABC):
     must implement, ensuring consistency across different services.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def generate_speech(self, text: str, output_filename: str) -> TTSResult:
         """
@@ -5,15 +5,22 @@ This module provides a high-level interface for generating speech
 through various TTS providers with automatic provider selection and fallback.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Type
 from datetime import datetime
-from .interface import TTSProvider, TTSResult, TTSStatus
+from .interface import ProviderStatus, TTSProvider, TTSResult, TTSStatus
 from .providers.kokoro import KokoroProvider
 from .providers.piper import PiperProvider
 from src.time_reclamation.config import get_config_manager
 from src.time_reclamation.infrastructure import get_logger
 
 
+# Provider classes keyed by the `type` value used in configuration
+_PROVIDER_REGISTRY: Dict[str, Type[TTSProvider]] = {
+    "kokoro": KokoroProvider,
+    "piper": PiperProvider,
+}
+
+
 class TTSManager:
     """
     High-level TTS manager that handles multiple providers.
@@ -22,11 +29,14 @@ class TTSManager:
     and automatically handles provider selection, configuration, and resource management.
     """
     
+    __slots__ = ('logger', '_providers', '_provider_instances', '_status_cache')
+    
     def __init__(self):
         """Initialize the TTS manager."""
         self.logger = get_logger()
         self._providers: Dict[str, TTSProvider] = {}  # keyed by instance name
         self._provider_instances: Dict[str, Dict[str, Any]] = {}  # metadata about instances
+        self._status_cache: Optional[Dict[str, ProviderStatus]] = None  # provider status snapshot (built on first use)
         self._initialize_providers()
     
     def _initialize_providers(self) -> None:
@@ -57,14 +67,13 @@ class TTSManager:
                     continue
                 
                 # Create provider based on type
-                if provider_type == "kokoro":
-                    provider = KokoroProvider(instance_name, config_dict)
-                elif provider_type == "piper":
-                    provider = PiperProvider(instance_name, config_dict)
-                else:
+                provider_class = _PROVIDER_REGISTRY.get(provider_type)
+                if provider_class is None:
                     self.logger.warning(f"Unknown TTS provider type: {provider_type} for instance: {instance_name}")
                     continue
                 
+                provider = provider_class(instance_name, config_dict)
+                
                 # Register the provider
                 self._providers[instance_name] = provider
                 self._provider_instances[instance_name] = {
@@ -117,9 +126,9 @@ class TTSManager:
             str: Generated or validated filename
         """
         if user_filename:
-            # Ensure it has .wav extension
-            if not user_filename.lower().endswith('.wav'):
-                user_filename += '.wav'
+            # Ensure it has .wav extension (only the suffix is lowercased)
+            if user_filename[-4:].lower() != '.wav':
+                user_filename = f"{user_filename}.wav"
             return user_filename
         
         # Generate timestamp-based filename
@@ -184,12 +193,14 @@ class TTSManager:
         
         return result
     
-    def test_providers(self, instance_name: Optional[str] = None) -> Dict[str, TTSResult]:
+    def test_providers(self, instance_name: Optional[str] = None,
+                       provider_status: Optional[Dict[str, ProviderStatus]] = None) -> Dict[str, TTSResult]:
         """
         Test TTS provider instances.
         
         Args:
             instance_name: Specific instance to test (optional, tests all if not provided)
+            provider_status: Status snapshot from get_provider_status() (optional, avoids re-checking configuration)
         
         Returns:
             Dict[str, TTSResult]: Test results for each instance
@@ -209,7 +220,9 @@ class TTSManager:
             provider = self._providers[name]
             self.logger.info(f"Testing {provider.provider_name} provider...")
             
-            if not provider.is_configured():
+            status = provider_status.get(name) if provider_status else None
+            configured = status.configured if status is not None else provider.is_configured()
+            if not configured:
                 results[name] = TTSResult(
                     status=TTSStatus.FAILED,
                     error_details=f"{provider.provider_name} provider is not configured"
@@ -226,32 +239,44 @@ class TTSManager:
         Returns:
             bool: True if at least one provider instance is configured
         """
-        return len(self.get_available_instances()) > 0
+        return any(status.available for status in self.get_provider_status().values())
     
-    def get_provider_status(self) -> Dict[str, Dict[str, Any]]:
+    def get_provider_status(self, cached: bool = True) -> Dict[str, ProviderStatus]:
         """
         Get status information for all provider instances.
         
+        Providers are fixed for the lifetime of the manager, so the snapshot
+        is computed once and reused.
+        
+        Args:
+            cached: Return the last snapshot if there is one (default True)
+        
         Returns:
-            Dict[str, Dict[str, Any]]: Status information for each instance
+            Dict[str, ProviderStatus]: Status information for each instance
         """
+        if cached and self._status_cache is not None:
+            return self._status_cache
+        
         status = {}
+        available = set(self.get_available_instances())
         
         for instance_name, provider in self._providers.items():
             metadata = self._provider_instances.get(instance_name, {})
-            status[instance_name] = {
-                'name': provider.provider_name,
-                'type': metadata.get('type', 'unknown'),
-                'configured': provider.is_configured(),
-                'available': instance_name in self.get_available_instances()
-            }
+            status[instance_name] = ProviderStatus(
+                name=provider.provider_name,
+                type=metadata.get('type', 'unknown'),
+                configured=provider.is_configured(),
+                available=instance_name in available
+            )
         
+        self._status_cache = status
         return status
     
     def cleanup_all(self) -> None:
         """
         Clean up all provider resources.
         """
+        self._status_cache = None
         for provider in self._providers.values():
             try:
                 provider.cleanup()
@@ -6,14 +6,20 @@ kokoro library, adapted for the TimeReclamation project.
 """
 
 import os
+import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 from ..interface import TTSProvider, TTSResult, TTSStatus
 from src.time_reclamation.config import get_config_manager
 from src.time_reclamation.infrastructure import get_logger
 
 
+# Largest audio buffer kept for reuse (five minutes at 24 kHz); larger ones
+# are dropped after the request so one long text doesn't pin the memory
+_MAX_POOLED_SAMPLES = 24000 * 60 * 5
+
+
 class KokoroProvider(TTSProvider):
     """
     Kokoro TTS provider implementation.
@@ -22,6 +28,13 @@ class KokoroProvider(TTSProvider):
     speech using the Kokoro-82M model.
     """
     
+    __slots__ = (
+        'logger', 'instance_name', 'voice', 'lang_code', 'repo_id',
+        'sample_rate', 'output_dir', 'device',
+        '_pipeline', '_pipeline_loaded', '_output_dir_ready',
+        '_buf', '_buf_lock',
+    )
+    
     def __init__(self, instance_name: str, config: Dict[str, Any]):
         """
         Initialize the Kokoro provider with instance-specific configuration.
@@ -45,6 +58,13 @@ class KokoroProvider(TTSProvider):
         self._pipeline = None
         self._pipeline_loaded = False
         
+        # Output directory is created once per provider lifetime
+        self._output_dir_ready: bool = False
+        
+        # Idle audio buffer reused across requests; the lock only guards the handoff
+        self._buf = None
+        self._buf_lock = threading.Lock()
+        
         self.logger.debug(f"Kokoro provider '{instance_name}' initialized with voice: {self.voice}")
     
     @property
@@ -84,6 +104,7 @@ class KokoroProvider(TTSProvider):
             from kokoro import KPipeline
         except ImportError:
             self.logger.error("kokoro is not installed. Please install it with: pip install kokoro")
+            self._pipeline_loaded = True  # Mark as attempted, don't retry the import
             return False
         
         start_time = time.time()
@@ -142,14 +163,137 @@ class KokoroProvider(TTSProvider):
         Returns:
             bool: True if directory exists or was created successfully
         """
+        if self._output_dir_ready:
+            return True
+        
         try:
             output_path = Path(self.output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready = True
             return True
         except Exception as e:
             self.logger.error(f"Failed to create output directory '{self.output_dir}': {str(e)}")
             return False
     
+    def _take_buffer(self) -> Any:
+        """
+        Take the idle audio buffer out of the pool.
+        
+        Returns:
+            The pooled buffer, or None if it is in use or was never allocated
+        """
+        with self._buf_lock:
+            buffer, self._buf = self._buf, None
+        return buffer
+    
+    def _release_buffer(self, buffer: Any) -> None:
+        """
+        Return an audio buffer to the pool once a request is done with it.
+        
+        Buffers above `_MAX_POOLED_SAMPLES` are dropped, and the pool keeps
+        only one idle buffer.
+        
+        Args:
+            buffer: Buffer to return (None is ignored)
+        """
+        if buffer is None or buffer.size > _MAX_POOLED_SAMPLES:
+            return
+        with self._buf_lock:
+            if self._buf is None or self._buf.size < buffer.size:
+                self._buf = buffer
+    
+    @staticmethod
+    def _grow_buffer(buffer: Any, size: int, used: int) -> Any:
+        """
+        Ensure an audio buffer can hold at least `size` samples.
+        
+        The buffer grows by doubling and keeps its first `used` samples.
+        
+        Args:
+            buffer: Current buffer (None to allocate a new one)
+            size: Number of samples the buffer must hold
+            used: Number of samples already written to the buffer
+            
+        Returns:
+            The buffer, or a larger copy of it
+        """
+        import numpy as np
+        
+        if buffer is None or buffer.size < size:
+            current = buffer.size if buffer is not None else 0
+            grown = np.empty(max(size, current * 2), dtype=np.float32)
+            if used:
+                grown[:used] = buffer[:used]
+            buffer = grown
+        
+        return buffer
+    
+    def _synthesize_to_memory(self, text: str, buffer: Any) -> Tuple[Any, int, int, float]:
+        """
+        Run the Kokoro pipeline and combine the generated chunks in memory.
+        
+        Chunks are copied into `buffer`, which is replaced by a larger one
+        when it runs out of room. The caller owns the returned buffer and
+        should hand it back with `_release_buffer()`.
+        
+        Args:
+            text: The text to convert to speech
+            buffer: Buffer from `_take_buffer()` (may be None)
+            
+        Returns:
+            Tuple[Any, int, int, float]: Buffer holding the audio, number of
+            samples written (0 if no chunks were generated), number of chunks
+            and generation time
+        """
+        import numpy as np
+        
+        self.logger.debug(f"Generating speech for text: {text[:50]}...")
+        generation_start = time.time()
+        
+        generator = self._pipeline(text, voice=self.voice)
+        
+        # Copy audio chunks into the buffer as they arrive
+        samples = 0
+        chunk_count = 0
+        
+        debug_enabled = self.logger.debug_enabled
+        
+        for i, (gs, ps, audio) in enumerate(generator):
+            if debug_enabled:
+                self.logger.debug("Chunk %d: gs=%s, ps=%s, samples=%d", i, gs, ps, len(audio))
+            audio = np.asarray(audio, dtype=np.float32)
+            end = samples + len(audio)
+            buffer = self._grow_buffer(buffer, end, samples)
+            buffer[samples:end] = audio
+            samples = end
+            chunk_count += 1
+        
+        generation_time = time.time() - generation_start
+        
+        return buffer, samples, chunk_count, generation_time
+    
+    def _write_audio(self, output_path: Path, audio: Any) -> None:
+        """
+        Write audio to a temporary sibling file and rename it into place.
+        
+        The rename is atomic within the output directory, so consumers never
+        see a partially written WAV file and the data is written only once.
+        
+        Args:
+            output_path: Final path of the audio file
+            audio: Audio samples to write
+        """
+        import soundfile as sf
+        
+        temp_path = output_path.with_name(f".{output_path.name}.tmp")
+        try:
+            sf.write(str(temp_path), audio, self.sample_rate, format='WAV')
+            os.replace(temp_path, output_path)
+        except Exception:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+    
     def generate_speech(self, text: str, output_filename: str) -> TTSResult:
         """
         Generate speech from text and save to file.
@@ -195,47 +339,24 @@ class KokoroProvider(TTSProvider):
         
         start_time = time.time()
         
+        buffer = self._take_buffer()
         try:
-            import soundfile as sf
-            import numpy as np
-            
-            # Generate audio chunks
-            self.logger.debug(f"Generating speech for text: {text[:50]}...")
-            generation_start = time.time()
-            
-            generator = self._pipeline(text, voice=self.voice)
-            
-            # Collect all audio chunks
-            audio_chunks = []
-            chunk_count = 0
+            # Generate and combine audio chunks
+            buffer, sample_count, chunk_count, generation_time = self._synthesize_to_memory(text, buffer)
             
-            for i, (gs, ps, audio) in enumerate(generator):
-                self.logger.debug(f"Chunk {i}: gs={gs}, ps={ps}, samples={len(audio)}")
-                audio_chunks.append(audio)
-                chunk_count += 1
-            
-            generation_end = time.time()
-            generation_time = generation_end - generation_start
-            
-            # Combine all chunks into a single audio array
-            if not audio_chunks:
+            if not sample_count:
                 return TTSResult(
                     status=TTSStatus.FAILED,
                     error_details="No audio chunks generated",
                     generation_time=generation_time
                 )
             
-            combined_audio = np.concatenate(audio_chunks)
-            
             # Calculate audio duration
-            audio_duration = len(combined_audio) / self.sample_rate
+            audio_duration = sample_count / self.sample_rate
             
             # Save combined audio to file
             output_path = Path(self.output_dir) / output_filename
-            sf.write(str(output_path), combined_audio, self.sample_rate)
-            
-            end_time = time.time()
-            total_time = end_time - start_time
+            self._write_audio(output_path, buffer[:sample_count])
             
             self.logger.info(f"Speech generated successfully in {self._format_time(generation_time)}")
             self.logger.info(f"Audio duration: {audio_duration:.2f}s, Chunks: {chunk_count}")
@@ -248,7 +369,7 @@ class KokoroProvider(TTSProvider):
                 audio_duration=audio_duration,
                 provider_response={
                     'chunks': chunk_count,
-                    'samples': len(combined_audio),
+                    'samples': sample_count,
                     'sample_rate': self.sample_rate
                 }
             )
@@ -271,11 +392,16 @@ class KokoroProvider(TTSProvider):
                 error_details=f"Error generating speech: {str(e)}",
                 generation_time=total_time
             )
+        finally:
+            self._release_buffer(buffer)
     
     def test_connection(self) -> TTSResult:
         """
         Test the TTS provider with a simple phrase.
         
+        The phrase is synthesized in memory only, so no test file is
+        written to (or removed from) the output directory.
+        
         Returns:
             TTSResult: Result of the connection test
         """
@@ -285,33 +411,54 @@ class KokoroProvider(TTSProvider):
                 error_details="Kokoro provider is not properly configured"
             )
         
-        # Test with a simple phrase
-        test_text = "Hello! This is a connection test."
-        test_filename = f"test_{self.instance_name}_{int(time.time())}.wav"
+        if not self._initialize_pipeline() or self._pipeline is None:
+            return TTSResult(
+                status=TTSStatus.FAILED,
+                error_details="Failed to initialize the Kokoro pipeline"
+            )
         
-        result = self.generate_speech(test_text, test_filename)
+        start_time = time.time()
         
-        if result.status == TTSStatus.SUCCESS:
-            # Clean up test file
-            try:
-                if result.output_file and os.path.exists(result.output_file):
-                    os.remove(result.output_file)
-                    self.logger.debug(f"Cleaned up test file: {result.output_file}")
-            except Exception as e:
-                self.logger.warning(f"Failed to clean up test file: {str(e)}")
-            
+        buffer = self._take_buffer()
+        try:
+            buffer, sample_count, _, generation_time = self._synthesize_to_memory("Hi.", buffer)
+        except ImportError as e:
+            self.logger.error(f"Missing dependency: {str(e)}")
             return TTSResult(
-                status=TTSStatus.SUCCESS,
-                output_file=None,
-                generation_time=result.generation_time,
-                audio_duration=result.audio_duration,
-                provider_response={
-                    'message': f"Connection successful. Voice: {self.voice}, Language: {self.lang_code}",
-                    'test_duration': result.audio_duration
-                }
+                status=TTSStatus.FAILED,
+                error_details=f"Missing dependency: {str(e)}. Please install: pip install numpy",
+                generation_time=time.time() - start_time
             )
+        except Exception as e:
+            total_time = time.time() - start_time
+            self.logger.error(f"Error generating speech after {self._format_time(total_time)}: {str(e)}")
+            return TTSResult(
+                status=TTSStatus.FAILED,
+                error_details=f"Error generating speech: {str(e)}",
+                generation_time=total_time
+            )
+        finally:
+            self._release_buffer(buffer)
+        
+        if not sample_count:
+            return TTSResult(
+                status=TTSStatus.FAILED,
+                error_details="No audio chunks generated",
+                generation_time=generation_time
+            )
+        
+        audio_duration = sample_count / self.sample_rate
         
-        return result
+        return TTSResult(
+            status=TTSStatus.SUCCESS,
+            output_file=None,
+            generation_time=generation_time,
+            audio_duration=audio_duration,
+            provider_response={
+                'message': f"Connection successful. Voice: {self.voice}, Language: {self.lang_code}",
+                'test_duration': audio_duration
+            }
+        )
     
     def cleanup(self) -> None:
         """
@@ -321,4 +468,5 @@ class KokoroProvider(TTSProvider):
             del self._pipeline
             self._pipeline = None
             self._pipeline_loaded = False
+            self._buf = None
             self.logger.debug(f"Kokoro pipeline resources cleaned up for {self.instance_name}")
\ No newline at end of file
@@ -5,16 +5,238 @@ This module implements the Piper TTS provider using the
 piper-tts library, adapted for the TimeReclamation project.
 """
 
+import json
 import os
+import re
+import threading
 import time
 import wave
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 from ..interface import TTSProvider, TTSResult, TTSStatus
 from src.time_reclamation.config import get_config_manager
 from src.time_reclamation.infrastructure import get_logger
 
 
+# Sentence batching for parallel synthesis
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+_MAX_BATCH_CHARS = 200
+
+# Split the CPU between synthesis workers and ONNX Runtime's intra-op threads
+# so concurrent batches don't oversubscribe the cores
+_SYNTHESIS_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+_INTRA_OP_THREADS = max(1, (os.cpu_count() or 1) // _SYNTHESIS_WORKERS)
+
+# Rough speech rate used to size the WAV preallocation (seconds per character)
+_SECONDS_PER_CHAR = 0.08
+
+
+# Process-wide voice cache keyed by resolved model path: key -> [voice, refcount]
+# Voices stay loaded while idle so recreated providers skip the model load;
+# idle entries beyond PIPER_VOICE_CACHE_MAX are evicted least recently used first
+_VOICE_CACHE: "OrderedDict[str, List[Any]]" = OrderedDict()
+_VOICE_CACHE_LOCK = threading.Lock()
+_VOICE_CACHE_MAX = max(1, int(os.environ.get('PIPER_VOICE_CACHE_MAX', '2')))
+
+
+def _acquire_cached_voice(key: str) -> Optional[Any]:
+    """
+    Take a reference to a cached voice.
+    
+    Args:
+        key: Resolved model path
+        
+    Returns:
+        Optional[Any]: The cached PiperVoice, or None on a cache miss
+    """
+    with _VOICE_CACHE_LOCK:
+        entry = _VOICE_CACHE.get(key)
+        if entry is None:
+            return None
+        entry[1] += 1
+        _VOICE_CACHE.move_to_end(key)
+        return entry[0]
+
+
+def _store_voice(key: str, voice: Any) -> Any:
+    """
+    Add a freshly loaded voice to the cache and take a reference to it.
+    
+    If another provider cached the same model meanwhile, that voice is
+    returned instead so both share one session.
+    
+    Args:
+        key: Resolved model path
+        voice: The loaded PiperVoice
+        
+    Returns:
+        Any: The cached PiperVoice
+    """
+    with _VOICE_CACHE_LOCK:
+        entry = _VOICE_CACHE.get(key)
+        if entry is None:
+            entry = _VOICE_CACHE[key] = [voice, 0]
+        entry[1] += 1
+        _VOICE_CACHE.move_to_end(key)
+        _evict_idle_voices()
+        return entry[0]
+
+
+def _release_voice(key: str) -> None:
+    """
+    Drop a reference to a cached voice.
+    
+    Args:
+        key: Resolved model path
+    """
+    with _VOICE_CACHE_LOCK:
+        entry = _VOICE_CACHE.get(key)
+        if entry is None:
+            return
+        entry[1] = max(0, entry[1] - 1)
+        _evict_idle_voices()
+
+
+def _evict_idle_voices() -> None:
+    """
+    Evict unreferenced voices until the cache fits _VOICE_CACHE_MAX.
+    
+    Must be called with _VOICE_CACHE_LOCK held.
+    """
+    excess = len(_VOICE_CACHE) - _VOICE_CACHE_MAX
+    if excess <= 0:
+        return
+    idle_keys = [key for key, (_, refs) in _VOICE_CACHE.items() if refs == 0]
+    for key in idle_keys[:excess]:
+        del _VOICE_CACHE[key]
+
+
+def _format_milliseconds(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}ms"
+
+
+def _format_seconds(seconds: float) -> str:
+    return f"{seconds:.2f}s"
+
+
+def _format_minutes(seconds: float) -> str:
+    minutes, remaining_seconds = divmod(seconds, 60)
+    return f"{int(minutes)}m {remaining_seconds:.1f}s"
+
+
+def _format_hours(seconds: float) -> str:
+    hours, remainder = divmod(seconds, 3600)
+    minutes, remaining_seconds = divmod(remainder, 60)
+    return f"{int(hours)}h {int(minutes)}m {remaining_seconds:.1f}s"
+
+
+# Duration formatters by upper bound in seconds, checked in order
+_TIME_FMT = (
+    (1, _format_milliseconds),
+    (60, _format_seconds),
+    (3600, _format_minutes),
+    (float('inf'), _format_hours),
+)
+
+
+class _Timer:
+    """
+    Monotonic stopwatch based on time.perf_counter.
+    
+    The timer starts when created (or when entered as a context manager).
+    While running, elapsed reports the time so far; after the with block
+    exits it holds the final duration.
+    """
+    
+    __slots__ = ('_start', '_end')
+    
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._end = None
+    
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        self._end = None
+        return self
+    
+    def __exit__(self, *exc_info) -> bool:
+        self._end = time.perf_counter()
+        return False
+    
+    @property
+    def elapsed(self) -> float:
+        """Elapsed time in seconds."""
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+
+def _concat_pcm_numpy(chunks_flat, offsets, xfade: int):
+    """
+    Concatenate int16 PCM chunks, linearly crossfading xfade samples at each boundary.
+    
+    Args:
+        chunks_flat: All chunks back to back as one int16 array
+        offsets: Start index of each chunk followed by the total length
+        xfade: Samples overlapped at each boundary (at most half the shortest chunk)
+        
+    Returns:
+        The joined int16 array, xfade samples shorter per boundary
+    """
+    import numpy as np
+    
+    count = len(offsets) - 1
+    if xfade <= 0 or count < 2:
+        return chunks_flat.copy()
+    
+    ramp = np.arange(xfade, dtype=np.float32) / xfade
+    parts = []
+    for k in range(count):
+        start, stop = offsets[k], offsets[k + 1]
+        if k > 0:
+            tail = chunks_flat[start - xfade:start].astype(np.float32)
+            head = chunks_flat[start:start + xfade].astype(np.float32)
+            parts.append((tail * (1.0 - ramp) + head * ramp).astype(np.int16))
+        body_start = start + xfade if k > 0 else start
+        body_stop = stop - xfade if k < count - 1 else stop
+        parts.append(chunks_flat[body_start:body_stop])
+    return np.concatenate(parts)
+
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    Split text on sentence terminators into batches of bounded length.
+    
+    Consecutive sentences are packed together until a batch would exceed
+    _MAX_BATCH_CHARS; a single longer sentence is kept whole.
+    
+    This split runs before Piper's own sentence segmentation and does not
+    always agree with it (e.g. after abbreviations), and whitespace between
+    batches is lost. Multi-batch output can therefore differ from a single
+    synthesize() call in the pauses and prosody at batch boundaries.
+    
+    Args:
+        text: The text to split
+        
+    Returns:
+        List[str]: Text batches in their original order
+    """
+    batches = []
+    current = ""
+    for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > _MAX_BATCH_CHARS:
+            batches.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        batches.append(current)
+    return batches
+
+
 class PiperProvider(TTSProvider):
     """
     Piper TTS provider implementation.
@@ -36,11 +258,33 @@ class PiperProvider(TTSProvider):
         
         # Extract configuration values
         self.model_path = config.get('model_path', '')
+        self._model_path_obj = Path(self.model_path)
+        self._config_json_path = Path(f"{self.model_path}.json")
         self.output_dir = config.get('output_dir', 'cache_data/tts')
         
+        # Output directory is created once per provider lifetime
+        self._output_dir_ready: bool = False
+        
+        # Optional int8 quantization of the voice model
+        self.quantize = config.get('quantize', False)
+        default_quantized_path = (
+            str(self._model_path_obj.with_suffix('.int8.onnx')) if self.model_path else ''
+        )
+        self.quantized_model_path = config.get('quantized_model_path') or default_quantized_path
+        
+        # Crossfade between parallel sentence batches to hide boundary clicks
+        self.crossfade_ms = config.get('crossfade_ms', 0)
+        
+        # Cached result of the configuration check
+        self._configured: Optional[bool] = None
+        
         # Voice instance (lazy loaded)
         self._voice = None
         self._voice_loaded = False
+        self._voice_key = None
+        
+        # Worker pool for parallel sentence batches (lazy created)
+        self._executor = None
         
         self.logger.debug(f"Piper provider '{instance_name}' initialized with model: {self.model_path}")
     
@@ -53,27 +297,39 @@ class PiperProvider(TTSProvider):
         """
         Check if the provider is properly configured.
         
+        A successful check is cached so the model files are not stat'ed on
+        every synthesis. The cache is dropped whenever loading the voice or
+        synthesis fails, so a model moved or deleted afterwards is noticed.
+        
         Returns:
             bool: True if the provider is ready to generate speech
         """
+        if self._configured:
+            return True
+        
         # Check if model path is provided
         if not self.model_path:
             return False
         
         # Check if model file exists
-        model_file = Path(self.model_path)
-        if not model_file.exists():
+        if not self._model_path_obj.exists():
             self.logger.warning(f"Model file not found: {self.model_path}")
             return False
         
         # Check if model config file exists (.onnx.json)
-        config_file = Path(str(self.model_path) + '.json')
-        if not config_file.exists():
-            self.logger.warning(f"Model config file not found: {config_file}")
+        if not self._config_json_path.exists():
+            self.logger.warning(f"Model config file not found: {self._config_json_path}")
             return False
         
+        self._configured = True
         return True
     
+    def _invalidate_config_cache(self) -> None:
+        """
+        Forget the cached configuration check so the next is_configured() rechecks the files.
+        """
+        self._configured = None
+    
     def _initialize_voice(self) -> bool:
         """
         Initialize the Piper voice with lazy loading.
@@ -86,32 +342,93 @@ class PiperProvider(TTSProvider):
         
         try:
             # Import piper
-            from piper import PiperVoice
+            import onnxruntime
+            from piper import PiperConfig, PiperVoice
         except ImportError:
             self.logger.error("piper-tts is not installed. Please install it with: pip install piper-tts")
             return False
         
-        start_time = time.time()
+        load_timer = _Timer()
         
         try:
+            session_model_path = self._resolve_session_model_path()
+            voice_key = str(Path(session_model_path).resolve())
+            
+            # Reuse a voice already loaded by another provider instance
+            cached_voice = _acquire_cached_voice(voice_key)
+            if cached_voice is not None:
+                self._voice = cached_voice
+                self._voice_key = voice_key
+                self._voice_loaded = True
+                self.logger.debug(f"Reusing cached Piper voice model for '{self.model_path}'")
+                return True
+            
             self.logger.info(f"Loading Piper voice model from '{self.model_path}'...")
             
-            # Load the voice model
-            self._voice = PiperVoice.load(self.model_path)
+            # Load the voice model with an ONNX session sized for batched synthesis
+            with open(self._config_json_path, "r", encoding="utf-8") as config_file:
+                voice_config = PiperConfig.from_dict(json.load(config_file))
             
-            end_time = time.time()
-            load_time = end_time - start_time
-            self.logger.info(f"Piper voice model loaded successfully in {self._format_time(load_time)}!")
+            session_options = onnxruntime.SessionOptions()
+            session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            session_options.enable_cpu_mem_arena = True
+            session_options.intra_op_num_threads = _INTRA_OP_THREADS
+            session = onnxruntime.InferenceSession(
+                session_model_path,
+                sess_options=session_options,
+                providers=["CPUExecutionProvider"]
+            )
+            self._voice = _store_voice(voice_key, PiperVoice(session=session, config=voice_config))
+            self._voice_key = voice_key
+            
+            self.logger.info(f"Piper voice model loaded successfully in {self._format_time(load_timer.elapsed)}!")
             self._voice_loaded = True
             return True
             
         except Exception as e:
-            end_time = time.time()
-            load_time = end_time - start_time
-            self.logger.error(f"Error initializing Piper voice after {self._format_time(load_time)}: {str(e)}")
+            self.logger.error(f"Error initializing Piper voice after {self._format_time(load_timer.elapsed)}: {str(e)}")
             self._voice_loaded = True  # Mark as attempted
+            self._invalidate_config_cache()
             return False
     
+    def _resolve_session_model_path(self) -> str:
+        """
+        Get the ONNX model path to load, quantizing the model on first use if enabled.
+        
+        The int8 model is produced once with dynamic quantization of the MatMul/Gemm
+        weights and reused afterwards. Any failure falls back to the FP32 model.
+        
+        Returns:
+            str: Path of the ONNX model to build the inference session from
+        """
+        if not self.quantize:
+            return str(self.model_path)
+        
+        if Path(self.quantized_model_path).exists():
+            self.logger.debug(f"Using quantized Piper model: {self.quantized_model_path}")
+            return self.quantized_model_path
+        
+        try:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+        except ImportError:
+            self.logger.warning("onnxruntime quantization tools are not available, using FP32 model")
+            return str(self.model_path)
+        
+        quantize_timer = _Timer()
+        try:
+            self.logger.info(f"Quantizing Piper model to int8: {self.quantized_model_path}")
+            quantize_dynamic(
+                str(self.model_path),
+                self.quantized_model_path,
+                weight_type=QuantType.QInt8,
+                op_types_to_quantize=['MatMul', 'Gemm']
+            )
+            self.logger.info(f"Piper model quantized in {self._format_time(quantize_timer.elapsed)}")
+            return self.quantized_model_path
+        except Exception as e:
+            self.logger.warning(f"Failed to quantize Piper model, using FP32 model: {str(e)}")
+            return str(self.model_path)
+    
     def _format_time(self, seconds: float) -> str:
         """
         Format time duration in a human-readable format.
@@ -122,19 +439,79 @@ class PiperProvider(TTSProvider):
         Returns:
             str: Formatted time string
         """
-        if seconds < 1:
-            return f"{seconds * 1000:.1f}ms"
-        elif seconds < 60:
-            return f"{seconds:.2f}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            remaining_seconds = seconds % 60
-            return f"{minutes}m {remaining_seconds:.1f}s"
-        else:
-            hours = int(seconds // 3600)
-            remaining_minutes = int((seconds % 3600) // 60)
-            remaining_seconds = seconds % 60
-            return f"{hours}h {remaining_minutes}m {remaining_seconds:.1f}s"
+        for threshold, formatter in _TIME_FMT:
+            if seconds < threshold:
+                return formatter(seconds)
+        return _format_hours(seconds)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the worker pool used for parallel sentence batches.
+        
+        Returns:
+            ThreadPoolExecutor: The shared executor for this provider
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=_SYNTHESIS_WORKERS,
+                thread_name_prefix=f"piper-{self.instance_name}"
+            )
+        return self._executor
+    
+    def _synthesize_batch(self, text: str) -> bytes:
+        """
+        Synthesize one text batch to raw PCM audio.
+        
+        Args:
+            text: The text batch to synthesize
+            
+        Returns:
+            bytes: 16-bit mono PCM audio for the batch
+        """
+        return b"".join(chunk.audio_int16_bytes for chunk in self._voice.synthesize(text))
+    
+    def _crossfade_batches(self, batch_audio: List[bytes]) -> bytes:
+        """
+        Join batch audio with a short linear crossfade at each boundary.
+        
+        Args:
+            batch_audio: Raw 16-bit PCM for each batch, in order
+            
+        Returns:
+            bytes: The joined PCM audio
+        """
+        import numpy as np
+        
+        chunks = [np.frombuffer(audio, dtype=np.int16) for audio in batch_audio]
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        
+        # Overlap at most half of the shortest batch so crossfades never meet
+        xfade = int(self._voice.config.sample_rate * self.crossfade_ms / 1000)
+        xfade = max(0, min(xfade, min(len(chunk) for chunk in chunks) // 2))
+        
+        return _concat_pcm_numpy(np.concatenate(chunks), offsets, xfade).tobytes()
+    
+    def _preallocate_audio_file(self, raw_file, text: str) -> None:
+        """
+        Reserve disk space for the expected audio so frames are written contiguously.
+        
+        The size is estimated from the text length; the caller truncates the
+        file to the real size afterwards. Skipped where posix_fallocate is
+        unavailable, and failures are ignored since this is only a hint.
+        
+        Args:
+            raw_file: Open binary file the WAV will be written to
+            text: The text being synthesized
+        """
+        if not hasattr(os, 'posix_fallocate'):
+            return
+        
+        expected_bytes = int(len(text) * _SECONDS_PER_CHAR * self._voice.config.sample_rate * 2)
+        try:
+            os.posix_fallocate(raw_file.fileno(), 0, expected_bytes)
+        except OSError as e:
+            self.logger.debug("Could not preallocate audio file: %s", e)
     
     def _ensure_output_directory(self) -> bool:
         """
@@ -143,9 +520,13 @@ class PiperProvider(TTSProvider):
         Returns:
             bool: True if directory exists or was created successfully
         """
+        if self._output_dir_ready:
+            return True
+        
         try:
             output_path = Path(self.output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready = True
             return True
         except Exception as e:
             self.logger.error(f"Failed to create output directory '{self.output_dir}': {str(e)}")
@@ -194,34 +575,71 @@ class PiperProvider(TTSProvider):
                 error_details="Piper voice model is not available"
             )
         
-        start_time = time.time()
+        total_timer = _Timer()
         
         try:
             # Generate audio and save to file
             self.logger.debug(f"Generating speech for text: {text[:50]}...")
-            generation_start = time.time()
             
             output_path = Path(self.output_dir) / output_filename
+            time_to_first_audio = None
+            batches = _split_sentences(text)
             
-            # Use Piper's synthesize method to write directly to WAV file
-            with wave.open(str(output_path), "wb") as wav_file:
-                self._voice.synthesize_wav(text, wav_file)
-            
-            generation_end = time.time()
-            generation_time = generation_end - generation_start
-            
-            # Calculate audio duration from the WAV file
-            audio_duration = None
+            # Write to a temporary sibling and rename it into place on success, so a
+            # failed synthesis never leaves a preallocated, half-written WAV behind
+            temp_path = output_path.with_name(f".{output_path.name}.tmp")
             try:
-                with wave.open(str(output_path), "rb") as wav_file:
-                    frames = wav_file.getnframes()
-                    rate = wav_file.getframerate()
-                    audio_duration = frames / float(rate)
-            except Exception as e:
-                self.logger.warning(f"Could not calculate audio duration: {str(e)}")
+                with _Timer() as generation_timer, open(temp_path, "wb+") as raw_file:
+                    self._preallocate_audio_file(raw_file, text)
+                    
+                    with wave.open(raw_file, "wb") as wav_file:
+                        wav_file.setnchannels(1)
+                        wav_file.setsampwidth(2)
+                        wav_file.setframerate(self._voice.config.sample_rate)
+                        
+                        if len(batches) > 1:
+                            # Synthesize sentence batches in parallel (ONNX Runtime releases
+                            # the GIL) and append their audio in submission order
+                            executor = self._get_executor()
+                            futures = [executor.submit(self._synthesize_batch, batch) for batch in batches]
+                            if self.crossfade_ms > 0:
+                                batch_audio = []
+                                for future in futures:
+                                    batch_audio.append(future.result())
+                                    if time_to_first_audio is None:
+                                        time_to_first_audio = generation_timer.elapsed
+                                wav_file.writeframesraw(self._crossfade_batches(batch_audio))
+                            else:
+                                for future in futures:
+                                    audio = future.result()
+                                    if time_to_first_audio is None:
+                                        time_to_first_audio = generation_timer.elapsed
+                                    wav_file.writeframesraw(audio)
+                        else:
+                            # Stream Piper's audio chunks into the WAV file as they are produced
+                            for chunk in self._voice.synthesize(text):
+                                if time_to_first_audio is None:
+                                    time_to_first_audio = generation_timer.elapsed
+                                wav_file.writeframesraw(chunk.audio_int16_bytes)
+                        
+                        # Calculate audio duration from the frames written
+                        audio_duration = None
+                        try:
+                            audio_duration = wav_file.getnframes() / float(wav_file.getframerate())
+                        except Exception as e:
+                            self.logger.warning(f"Could not calculate audio duration: {str(e)}")
+                    
+                    # Drop any preallocated space past the end of the audio
+                    raw_file.truncate()
+                
+                os.replace(temp_path, output_path)
+            except Exception:
+                if temp_path.exists():
+                    temp_path.unlink()
+                raise
             
-            end_time = time.time()
-            total_time = end_time - start_time
+            generation_time = generation_timer.elapsed
+            total_time = total_timer.elapsed
             
             self.logger.info(f"Speech generated successfully in {self._format_time(generation_time)}")
             if audio_duration:
@@ -235,13 +653,13 @@ class PiperProvider(TTSProvider):
                 audio_duration=audio_duration,
                 provider_response={
                     'model_path': self.model_path,
-                    'total_time': total_time
+                    'total_time': total_time,
+                    'ttft': time_to_first_audio
                 }
             )
             
         except ImportError as e:
-            end_time = time.time()
-            total_time = end_time - start_time
+            total_time = total_timer.elapsed
             self.logger.error(f"Missing dependency: {str(e)}")
             return TTSResult(
                 status=TTSStatus.FAILED,
@@ -249,8 +667,8 @@ class PiperProvider(TTSProvider):
                 generation_time=total_time
             )
         except Exception as e:
-            end_time = time.time()
-            total_time = end_time - start_time
+            total_time = total_timer.elapsed
+            self._invalidate_config_cache()
             self.logger.error(f"Error generating speech after {self._format_time(total_time)}: {str(e)}")
             return TTSResult(
                 status=TTSStatus.FAILED,
@@ -292,7 +710,7 @@ class PiperProvider(TTSProvider):
                 generation_time=result.generation_time,
                 audio_duration=result.audio_duration,
                 provider_response={
-                    'message': f"Connection successful. Model: {Path(self.model_path).name}",
+                    'message': f"Connection successful. Model: {self._model_path_obj.name}",
                     'test_duration': result.audio_duration
                 }
             )
@@ -303,8 +721,14 @@ class PiperProvider(TTSProvider):
         """
         Clean up voice resources.
         """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
         if self._voice is not None:
-            del self._voice
+            # Release our reference; the voice stays cached for other instances
+            _release_voice(self._voice_key)
             self._voice = None
+            self._voice_key = None
             self._voice_loaded = False
             self.logger.debug(f"Piper voice resources cleaned up for {self.instance_name}")
\ No newline at end of file
@@ -1,24 +1,51 @@
 """Command pattern implementation for the CLI system."""
 
-from typing import Dict, List, Optional
+import importlib
+from typing import Callable, Dict, List, Optional, Tuple
 from .commands.base import BaseCommand
-from .commands.version import VersionCommand
-from .commands.db_info import DbInfoCommand
-from .commands.notify_test import NotifyTestCommand
-from .commands.youtube import YouTubeCommand
-from .commands.llm import LLMCommand
-from .commands.tts import TTSCommand
-from .commands.summary import SummaryCommand
 from src.time_reclamation.infrastructure import get_logger
 
 
+# Default commands as (module, class name), in listing order.
+# Command modules keep their heavy imports (LLM/TTS/YouTube stacks) inside
+# the handlers, so loading the classes is cheap; names, descriptions and
+# aliases are read from the commands themselves once they are loaded.
+_DEFAULT_COMMANDS: Tuple[Tuple[str, str], ...] = (
+    (".commands.version", "VersionCommand"),
+    (".commands.db_info", "DbInfoCommand"),
+    (".commands.notify_test", "NotifyTestCommand"),
+    (".commands.youtube", "YouTubeCommand"),
+    (".commands.llm", "LLMCommand"),
+    (".commands.tts", "TTSCommand"),
+    (".commands.summary", "SummaryCommand"),
+)
+
+
+def _lazy_factory(module_name: str, class_name: str) -> Callable[[], BaseCommand]:
+    """
+    Build a factory that imports and instantiates a command on demand.
+    
+    Args:
+        module_name: Module path relative to this package
+        class_name: Command class name within the module
+        
+    Returns:
+        Callable that returns a new command instance
+    """
+    def factory() -> BaseCommand:
+        module = importlib.import_module(module_name, package=__package__)
+        return getattr(module, class_name)()
+    return factory
+
+
 class CommandRegistry:
     """Registry for managing available commands."""
     
     def __init__(self):
         """Initialize the command registry."""
+        self._pending: List[Callable[[], BaseCommand]] = []  # lazy commands not loaded yet
         self._commands: Dict[str, BaseCommand] = {}
-        self._aliases: Dict[str, str] = {}
+        self._aliases: Dict[str, str] = {}  # alias -> command name, one probe per lookup
         self.logger = get_logger()
         
         # Register default commands
@@ -26,13 +53,23 @@ class CommandRegistry:
     
     def _register_default_commands(self) -> None:
         """Register the default set of commands."""
-        self.register_command(VersionCommand())
-        self.register_command(DbInfoCommand())
-        self.register_command(NotifyTestCommand())
-        self.register_command(YouTubeCommand())
-        self.register_command(LLMCommand())
-        self.register_command(TTSCommand())
-        self.register_command(SummaryCommand())
+        for module_name, class_name in _DEFAULT_COMMANDS:
+            self.register_lazy_command(_lazy_factory(module_name, class_name))
+    
+    def register_lazy_command(self, factory: Callable[[], BaseCommand]) -> None:
+        """
+        Register a command that is instantiated when the registry is first queried.
+        
+        Args:
+            factory: Callable returning the command instance
+        """
+        self._pending.append(factory)
+    
+    def _load_pending(self) -> None:
+        """Instantiate the lazily registered commands and index their names and aliases."""
+        pending, self._pending = self._pending, []
+        for factory in pending:
+            self.register_command(factory())
     
     def register_command(self, command: BaseCommand) -> None:
         """
@@ -45,10 +82,9 @@ class CommandRegistry:
         self._commands[command.name] = command
         
         # Register aliases
-        for alias in command.aliases:
-            self._aliases[alias] = command.name
+        self._aliases.update(dict.fromkeys(command.aliases, command.name))
         
-        self.logger.debug(f"Registered command: {command.name}")
+        self.logger.debug("Registered command: %s", command.name)
     
     def get_command(self, name: str) -> Optional[BaseCommand]:
         """
@@ -60,11 +96,10 @@ class CommandRegistry:
         Returns:
             Command instance if found, None otherwise
         """
-        # Check if it's an alias first
-        if name in self._aliases:
-            name = self._aliases[name]
+        self._load_pending()
         
-        return self._commands.get(name)
+        # Resolve aliases to the command name (names map to themselves)
+        return self._commands.get(self._aliases.get(name, name))
     
     def get_all_commands(self) -> Dict[str, BaseCommand]:
         """
@@ -73,8 +108,33 @@ class CommandRegistry:
         Returns:
             Dictionary of command name to command instance
         """
+        self._load_pending()
         return self._commands.copy()
     
+    def get_command_descriptions(self) -> Dict[str, str]:
+        """
+        Get the description of every command.
+        
+        Returns:
+            Dictionary of command name to description
+        """
+        self._load_pending()
+        return {name: command.description for name, command in self._commands.items()}
+    
+    def get_command_aliases(self, name: str) -> List[str]:
+        """
+        Get the aliases of a command.
+        
+        Args:
+            name: Command name
+            
+        Returns:
+            List of aliases (empty if none or unknown)
+        """
+        self._load_pending()
+        command = self._commands.get(name)
+        return list(command.aliases) if command is not None else []
+    
     def list_command_names(self) -> List[str]:
         """
         Get a list of all command names.
@@ -82,6 +142,7 @@ class CommandRegistry:
         Returns:
             List of command names
         """
+        self._load_pending()
         return list(self._commands.keys())
     
     def command_exists(self, name: str) -> bool:
@@ -94,6 +155,7 @@ class CommandRegistry:
         Returns:
             True if command exists, False otherwise
         """
+        self._load_pending()
         return name in self._commands or name in self._aliases
 
 
@@ -155,20 +217,18 @@ class CommandInvoker:
         self.logger.error(f"Unknown command: '{command_name}'")
         
         # Show available commands
-        available_commands = self.registry.list_command_names()
+        available_commands = self.registry.get_command_descriptions()
         if available_commands:
             self.logger.info("Available commands:")
-            for cmd_name in available_commands:
-                command = self.registry.get_command(cmd_name)
-                if command:
-                    self.logger.print_command(cmd_name, command.description)
+            for cmd_name, description in available_commands.items():
+                self.logger.print_command(cmd_name, description)
         
         self.logger.info("\nUse '--help' for more information.")
         return 1
     
     def list_commands(self) -> None:
         """List all available commands with descriptions."""
-        commands = self.registry.get_all_commands()
+        commands = self.registry.get_command_descriptions()
         
         if not commands:
             self.logger.info("No commands available.")
@@ -176,12 +236,13 @@ class CommandInvoker:
         
         self.logger.print_header("Available Commands")
         
-        for name, command in commands.items():
-            self.logger.print_command(name, command.description)
+        for name, description in commands.items():
+            self.logger.print_command(name, description)
             
             # Show aliases if any
-            if command.aliases:
-                aliases_str = ", ".join(command.aliases)
+            aliases = self.registry.get_command_aliases(name)
+            if aliases:
+                aliases_str = ", ".join(aliases)
                 self.logger.print_bullet(f"Aliases: {aliases_str}", indent=4)
     
     def get_command_help(self, command_name: str) -> int:
@@ -1,13 +1,92 @@
 """Base command class for the command pattern implementation."""
 
+import time
 import traceback
 from abc import ABC, abstractmethod
-from typing import List
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from src.time_reclamation.infrastructure import get_logger
 
 
+# First arguments that ask a subcommand-style command for its help
+HELP_FLAGS = frozenset(("--help", "-h", "help"))
+
+# Provider status line templates keyed by (configured, available)
+_PROVIDER_STATUS_FORMATS = {
+    (True, True): "✓ %s (%s): %s - Configured and available",
+    (True, False): "⚠️  %s (%s): %s - Configured but not available",
+    (False, True): "✗ %s (%s): %s - Not configured",
+    (False, False): "✗ %s (%s): %s - Not configured",
+}
+
+# Fetches the status fields used in a status line with a single call
+_PROVIDER_STATUS_FIELDS = itemgetter('configured', 'available', 'type', 'name')
+
+
+def _provider_status_fields(status: Any) -> Tuple[Any, Any, Any, Any]:
+    """
+    Get (configured, available, type, name) from a provider status entry.
+    
+    Args:
+        status: Status entry from a manager's get_provider_status(), either a
+            dict or a record exposing the same fields as attributes
+        
+    Returns:
+        Tuple of (configured, available, type, name)
+    """
+    if isinstance(status, dict):
+        return _PROVIDER_STATUS_FIELDS(status)
+    return status.configured, status.available, status.type, status.name
+
+
+class CommandArgumentError(Exception):
+    """Raised when command line arguments cannot be parsed."""
+    pass
+
+
+def create_argument_parser(prog: str) -> Any:
+    """
+    Create an argument parser that raises instead of exiting on errors.
+    
+    Help is not registered automatically since commands render their own
+    help; add an explicit --help/-h flag where needed.
+    
+    Abbreviation matching is disabled, so each option token is resolved by a
+    single lookup in the parser's option table rather than a prefix scan
+    over every registered flag.
+    
+    Args:
+        prog: Program name shown in parser messages
+        
+    Returns:
+        argparse.ArgumentParser: The configured parser
+    """
+    import argparse
+    
+    class _CommandArgumentParser(argparse.ArgumentParser):
+        def error(self, message):
+            raise CommandArgumentError(message)
+    
+    return _CommandArgumentParser(prog=prog, add_help=False, allow_abbrev=False)
+
+
 class BaseCommand(ABC):
-    """Abstract base class for all commands."""
+    """
+    Abstract base class for all commands.
+    
+    name, description, aliases and usage may be overridden either with
+    properties or, when constant, with plain class attributes.
+    
+    Commands that parse with argparse build their parser through
+    create_argument_parser(), which imports argparse on first use; command
+    modules should not import it at module level.
+    """
+    
+    # Argument parser shared by all instances of a command class (built on first use)
+    _parser = None
+    
+    # Subcommand name -> handler method name, for commands with subcommands
+    _SUBCOMMANDS: Dict[str, str] = {}
     
     def __init__(self):
         """Initialize the base command."""
@@ -26,9 +105,9 @@ class BaseCommand(ABC):
         pass
     
     @property
-    def aliases(self) -> List[str]:
+    def aliases(self) -> Sequence[str]:
         """Return command aliases (optional)."""
-        return []
+        return ()
     
     @property
     def usage(self) -> str:
@@ -48,6 +127,62 @@ class BaseCommand(ABC):
         """
         pass
     
+    @classmethod
+    def _build_parser(cls) -> Any:
+        """
+        Build the argument parser for this command.
+        
+        Commands that parse their arguments with argparse override this; the
+        default parser accepts no arguments.
+        
+        Returns:
+            argparse.ArgumentParser: The command's parser
+        """
+        return create_argument_parser(cls.__name__)
+    
+    @classmethod
+    def get_parser(cls) -> Any:
+        """
+        Get this command's argument parser, building it once per class.
+        
+        Returns:
+            argparse.ArgumentParser: The cached parser
+        """
+        if cls.__dict__.get('_parser') is None:
+            cls._parser = cls._build_parser()
+        return cls._parser
+    
+    def parse_args(self, args: List[str]) -> Any:
+        """
+        Parse command line arguments with the cached parser.
+        
+        Args:
+            args: Command line arguments
+            
+        Returns:
+            argparse.Namespace: Parsed arguments
+            
+        Raises:
+            CommandArgumentError: If the arguments are invalid
+        """
+        return self.get_parser().parse_args(args)
+    
+    def find_subcommand(self, name: str) -> Tuple[str, Optional[Callable[..., int]]]:
+        """
+        Resolve a subcommand name through the class's _SUBCOMMANDS table.
+        
+        Args:
+            name: Subcommand name as typed (case-insensitive)
+            
+        Returns:
+            Tuple of (canonical name, bound handler or None if unknown)
+        """
+        # Only fold case when the name is not already canonical
+        if name not in self._SUBCOMMANDS:
+            name = name.lower()
+        handler_name = self._SUBCOMMANDS.get(name)
+        return name, getattr(self, handler_name) if handler_name else None
+    
     def validate_args(self, args: List[str]) -> bool:
         """
         Validate command arguments.
@@ -75,6 +210,72 @@ class BaseCommand(ABC):
             for alias in self.aliases:
                 self.logger.print_bullet(alias)
     
+    def format_provider_status(self, instance_name: str, status: Any) -> str:
+        """
+        Format a provider instance status line.
+        
+        Args:
+            instance_name: Name of the provider instance
+            status: Status entry from a manager's get_provider_status(), either a
+                dict or a record exposing the same fields as attributes
+            
+        Returns:
+            str: The status line
+        """
+        configured, available, provider_type, name = _provider_status_fields(status)
+        return _PROVIDER_STATUS_FORMATS[(bool(configured), bool(available))] % (instance_name, provider_type, name)
+    
+    def show_health(self, manager, provider_status: Dict[str, Any], success_status: Any,
+                    instance_name: Optional[str] = None) -> None:
+        """
+        Show provider status and connection test results as a single table.
+        
+        Connection tests run concurrently in the manager; latency is measured
+        from the start of the run until each instance's test completes.
+        
+        Args:
+            manager: LLM or notification manager instance
+            provider_status: Status snapshot from the manager's get_provider_status()
+            success_status: The providers' status enum member for a successful test
+            instance_name: Specific instance to check (optional, checks all if not provided)
+        """
+        self.logger.print_section("PROVIDER HEALTH")
+        
+        if not provider_status:
+            self.logger.print_bullet("No provider instances configured")
+            return
+        
+        latencies = {}
+        start = time.perf_counter()
+        
+        def record_latency(name: str, result) -> None:
+            latencies[name] = time.perf_counter() - start
+        
+        results = manager.test_providers(instance_name, on_result=record_latency)
+        
+        rows = [("INSTANCE", "TYPE", "CONFIGURED", "LATENCY", "CONNECTION")]
+        for name, result in results.items():
+            status = provider_status.get(name)
+            configured, _, provider_type, _ = (
+                _provider_status_fields(status) if status is not None else (False, False, 'unknown', name)
+            )
+            connection = "ok" if result.status == success_status else f"failed - {result.error_details}"
+            rows.append((
+                name,
+                provider_type,
+                "yes" if configured else "no",
+                f"{latencies[name] * 1000:.0f}ms",
+                connection,
+            ))
+        
+        # Pad every column but the last, which holds free-form error text
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]) - 1)]
+        lines = [
+            "  " + "  ".join(cell.ljust(width) for cell, width in zip(row, widths)) + "  " + row[-1]
+            for row in rows
+        ]
+        self.logger.print_block("\n".join(lines) + "\n")
+    
     def handle_error(self, error_message: str, exit_code: int = 1) -> int:
         """
         Handle command errors consistently.
@@ -87,7 +288,9 @@ class BaseCommand(ABC):
             Exit code
         """
         self.logger.error(error_message)
-        self.logger.error(f"Stack trace:\n{traceback.format_exc()}")
+        # Formatting the traceback walks the whole stack; only do it when it will be shown
+        if self.logger.debug_enabled:
+            self.logger.debug("Stack trace:\n%s", traceback.format_exc())
         return exit_code
     
     def handle_success(self, success_message: str = "") -> int:
@@ -5,6 +5,13 @@ from .base import BaseCommand
 from src.time_reclamation.infrastructure.database import get_database_manager
 
 
+# Kept as a single constant so sqlite3's per-connection statement cache reuses it
+_TABLE_COUNT_SQL = (
+    "SELECT COUNT(*) FROM sqlite_master "
+    "WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+)
+
+
 class DbInfoCommand(BaseCommand):
     """Command to display database status and information."""
     
@@ -99,14 +106,9 @@ class DbInfoCommand(BaseCommand):
         try:
             self.logger.print_section("DETAILS")
             
-            # Try to get table count (basic implementation)
-            with db_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT COUNT(*) as table_count 
-                    FROM sqlite_master 
-                    WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                """)
-                table_count = cursor.fetchone()[0]
+            # Count user tables on the cached read-only connection
+            with db_manager.get_connection(readonly=True) as conn:
+                table_count = conn.execute(_TABLE_COUNT_SQL).fetchone()[0]
                 self.logger.print_bullet(f"Tables: {table_count}")
                 
         except Exception as e:
@@ -1,8 +1,45 @@
 """LLM command implementation."""
 
-from typing import List
-from .base import BaseCommand
-from src.time_reclamation.infrastructure.llm import get_llm_manager, LLMStatus
+from functools import cached_property
+from typing import Any, List
+from .base import BaseCommand, CommandArgumentError, create_argument_parser
+
+
+# Help sections rendered once per color mode and written in a single call
+_LLM_HELP_SECTIONS = (
+    ("OPTIONS", (
+        "<instance_name>      Specify which LLM provider instance to use",
+        "--prompt <text>      The prompt to send to the LLM (required; repeat to batch prompts)",
+        "--prompts-file <f>   Read additional prompts from a file, one per line",
+        "--system <text>      System prompt to set context/behavior (optional)",
+        "--list               Show LLM provider instances without generating",
+        "--test [instance]    Test LLM provider connections",
+        "--status             Show status and connection tests as one health table",
+        "--help, -h           Show this help message",
+    )),
+    ("EXAMPLES", (
+        "python main.py llm --list",
+        "python main.py llm --test",
+        "python main.py llm --test local_llama",
+        "python main.py llm --status",
+        "python main.py llm --prompt 'Explain quantum computing'",
+        "python main.py llm local_llama --prompt 'Write a Python function'",
+        "python main.py llm --prompt 'Define latency' --prompt 'Define throughput'",
+        "python main.py llm --system 'You are a code expert' --prompt 'Fix this bug'",
+        "python -m time_reclamation ai --prompt 'What is machine learning?'",
+    )),
+    ("NOTES", (
+        "This command generates responses using configured LLM provider instances",
+        "Configure LLM provider instances in config.yml before using",
+        "Without instance name, the first available instance is used",
+        "System prompts help set the AI's behavior and context",
+        "Use aliases 'ai' or 'generate' as shortcuts for 'llm'",
+    )),
+)
+_LLM_HELP_CACHE = {}
+
+# Rule printed around generated responses
+_RULE = "=" * 60
 
 
 class LLMCommand(BaseCommand):
@@ -26,7 +63,29 @@ class LLMCommand(BaseCommand):
     @property
     def usage(self) -> str:
         """Return command usage string."""
-        return f"python -m time_reclamation {self.name} [<instance_name>] --prompt 'Your prompt' [--system 'System prompt'] [--list] [--test]"
+        return f"python -m time_reclamation {self.name} [<instance_name>] --prompt 'Your prompt' [--prompt ...] [--prompts-file <file>] [--system 'System prompt'] [--list] [--test] [--status]"
+    
+    @classmethod
+    def _build_parser(cls) -> Any:
+        """Build the llm command argument parser."""
+        parser = create_argument_parser("llm")
+        parser.add_argument("instance_name", nargs="?")
+        parser.add_argument("--prompt", dest="user_prompts", action="append", default=[])
+        parser.add_argument("--prompts-file", dest="prompts_file")
+        parser.add_argument("--system", dest="system_prompt")
+        parser.add_argument("--list", dest="list_only", action="store_true")
+        parser.add_argument("--status", dest="status_only", action="store_true")
+        # --test takes an optional instance name; bare --test stores ""
+        parser.add_argument("--test", nargs="?", const="", default=None)
+        parser.add_argument("--help", "-h", dest="help", action="store_true")
+        return parser
+    
+    @cached_property
+    def _manager(self):
+        """The LLM manager, resolved once per command instance."""
+        # Imported here so loading the command (e.g. for --help) skips the provider stack
+        from src.time_reclamation.infrastructure.llm import get_llm_manager
+        return get_llm_manager()
     
     def execute(self, args: List[str]) -> int:
         """
@@ -40,53 +99,44 @@ class LLMCommand(BaseCommand):
         """
         try:
             # Parse arguments
-            instance_name = None
-            user_prompt = None
-            system_prompt = None
-            list_only = False
-            test_only = False
-            test_instance = None
-            
-            i = 0
-            while i < len(args):
-                if args[i] == "--prompt" and i + 1 < len(args):
-                    user_prompt = args[i + 1]
-                    i += 2
-                elif args[i] == "--system" and i + 1 < len(args):
-                    system_prompt = args[i + 1]
-                    i += 2
-                elif args[i] == "--list":
-                    list_only = True
-                    i += 1
-                elif args[i] == "--test":
-                    test_only = True
-                    # Check if next arg is an instance name
-                    if i + 1 < len(args) and not args[i + 1].startswith("--"):
-                        test_instance = args[i + 1]
-                        i += 2
-                    else:
-                        i += 1
-                elif args[i] in ["--help", "-h"]:
-                    self.show_help()
-                    return 0
-                elif not args[i].startswith("--"):
-                    # First non-flag argument is the instance name
-                    if instance_name is None:
-                        instance_name = args[i]
-                        i += 1
-                    else:
-                        return self.handle_error(f"Unexpected argument: {args[i]}")
-                else:
-                    return self.handle_error(f"Unknown argument: {args[i]}")
+            try:
+                parsed = self.parse_args(args)
+            except CommandArgumentError as e:
+                return self.handle_error(f"Invalid arguments: {str(e)}")
+            
+            if parsed.help:
+                self.show_help()
+                return 0
+            
+            instance_name = parsed.instance_name
+            user_prompts = list(parsed.user_prompts)
+            system_prompt = parsed.system_prompt
+            list_only = parsed.list_only
+            test_only = parsed.test is not None
+            test_instance = parsed.test or None
+            
+            # Additional prompts, one per non-empty line
+            if parsed.prompts_file:
+                with open(parsed.prompts_file, 'r', encoding='utf-8') as f:
+                    user_prompts.extend(line.strip() for line in f if line.strip())
             
             # Get LLM manager
-            llm_manager = get_llm_manager()
+            llm_manager = self._manager
             
             # Display header
             self.logger.print_header("LLM System")
             
+            # Provider status snapshot, shared by the steps below
+            provider_status = llm_manager.get_provider_status()
+            
+            # Handle health check
+            if parsed.status_only:
+                from src.time_reclamation.infrastructure.llm import LLMStatus
+                self.show_health(llm_manager, provider_status, LLMStatus.SUCCESS, instance_name)
+                return self.handle_success()
+            
             # Show provider status
-            self._show_provider_status(llm_manager)
+            self._show_provider_status(provider_status)
             
             # Handle list only
             if list_only:
@@ -97,9 +147,12 @@ class LLMCommand(BaseCommand):
                 self._test_provider_connections(llm_manager, test_instance)
                 return self.handle_success()
             
-            # Generate response
-            if user_prompt:
-                self._generate_response(llm_manager, instance_name, user_prompt, system_prompt)
+            # Generate response(s)
+            if len(user_prompts) > 1:
+                self._generate_batch_responses(llm_manager, instance_name, user_prompts, system_prompt)
+                return self.handle_success()
+            elif user_prompts:
+                self._generate_response(llm_manager, instance_name, user_prompts[0], system_prompt)
                 return self.handle_success()
             else:
                 return self.handle_error("No prompt provided. Use --prompt 'Your prompt' or --help for usage information.")
@@ -107,33 +160,24 @@ class LLMCommand(BaseCommand):
         except Exception as e:
             return self.handle_error(f"Failed to execute LLM command: {str(e)}")
     
-    def _show_provider_status(self, llm_manager) -> None:
+    def _show_provider_status(self, provider_status) -> None:
         """
         Show the status of all LLM provider instances.
         
         Args:
-            llm_manager: LLM manager instance
+            provider_status: Status snapshot from the manager's get_provider_status()
         """
-        self.logger.print_section("LLM PROVIDER INSTANCES STATUS")
-        
-        provider_status = llm_manager.get_provider_status()
-        
-        if not provider_status:
-            self.logger.print_bullet("No LLM provider instances configured")
-            return
-        
-        for instance_name, status in provider_status.items():
-            name = status['name']
-            provider_type = status['type']
-            configured = status['configured']
-            available = status['available']
+        with self.logger.buffered():
+            self.logger.print_section("LLM PROVIDER INSTANCES STATUS")
             
-            if configured and available:
-                self.logger.print_bullet(f"✓ {instance_name} ({provider_type}): {name} - Configured and available")
-            elif configured:
-                self.logger.print_bullet(f"⚠️  {instance_name} ({provider_type}): {name} - Configured but not available")
-            else:
-                self.logger.print_bullet(f"✗ {instance_name} ({provider_type}): {name} - Not configured")
+            if not provider_status:
+                self.logger.print_bullet("No LLM provider instances configured")
+                return
+            
+            self.logger.print_bullets(
+                self.format_provider_status(instance_name, status)
+                for instance_name, status in provider_status.items()
+            )
     
     def _test_provider_connections(self, llm_manager, instance_name=None) -> None:
         """
@@ -145,19 +189,28 @@ class LLMCommand(BaseCommand):
         """
         self.logger.print_section("CONNECTION TESTS")
         
-        test_results = llm_manager.test_providers(instance_name)
+        # Results are printed as each test completes
+        test_results = llm_manager.test_providers(instance_name, on_result=self._print_test_result)
         
         if not test_results:
             self.logger.print_bullet("No LLM provider instances to test")
-            return
+    
+    def _print_test_result(self, instance_name: str, result) -> None:
+        """
+        Print the result of a single connection test.
         
-        for instance_name, result in test_results.items():
-            if result.status == LLMStatus.SUCCESS:
-                self.logger.print_bullet(f"✓ {instance_name}: {result.response}")
-                if result.generation_time:
-                    self.logger.print_bullet(f"  Response time: {result.generation_time:.2f}s", indent=4)
-            else:
-                self.logger.print_bullet(f"✗ {instance_name}: {result.error_details}")
+        Args:
+            instance_name: Name of the tested instance
+            result: Test result for the instance
+        """
+        from src.time_reclamation.infrastructure.llm import LLMStatus
+        
+        if result.status == LLMStatus.SUCCESS:
+            self.logger.print_bullet(f"✓ {instance_name}: {result.response}")
+            if result.generation_time:
+                self.logger.print_bullet(f"  Response time: {result.generation_time:.2f}s", indent=4)
+        else:
+            self.logger.print_bullet(f"✗ {instance_name}: {result.error_details}")
     
     def _generate_response(self, llm_manager, instance_name=None, user_prompt=None, system_prompt=None) -> None:
         """
@@ -169,6 +222,8 @@ class LLMCommand(BaseCommand):
             user_prompt: User's input prompt
             system_prompt: System prompt (optional)
         """
+        from src.time_reclamation.infrastructure.llm import LLMStatus
+        
         self.logger.print_section("GENERATING RESPONSE")
         
         if not llm_manager.is_any_provider_configured():
@@ -183,23 +238,64 @@ class LLMCommand(BaseCommand):
         if system_prompt:
             self.logger.print_bullet(f"System: {system_prompt}")
         
-        # Generate the response
-        result = llm_manager.generate_response(user_prompt, instance_name, system_prompt)
+        # Stream the response to stdout as it is generated
+        streaming = []
+        
+        def write_chunk(text: str) -> None:
+            if not streaming:
+                streaming.append(True)
+                self.logger.print_section("RESPONSE")
+                print("\n" + _RULE)
+            self.logger.print_block(text)
+        
+        result = llm_manager.generate_stream(user_prompt, write_chunk, instance_name, system_prompt)
+        if streaming:
+            print("\n" + _RULE + "\n")
         
         if result.status == LLMStatus.SUCCESS:
-            self.logger.print_section("RESPONSE")
             self.logger.print_bullet("✓ Response generated successfully")
             if result.generation_time:
                 self.logger.print_bullet(f"Generation time: {result.generation_time:.2f}s")
-            
-            # Print the response with proper formatting
-            print("\n" + "="*60)
-            print(result.response)
-            print("="*60 + "\n")
-            
         else:
             self.logger.print_bullet(f"✗ Failed to generate response: {result.error_details}")
     
+    def _generate_batch_responses(self, llm_manager, instance_name=None, user_prompts=None, system_prompt=None) -> None:
+        """
+        Generate responses for several prompts, marshaled into as few requests as possible.
+        
+        Args:
+            llm_manager: LLM manager instance
+            instance_name: Specific instance to use (optional)
+            user_prompts: User prompts to answer
+            system_prompt: System prompt (optional)
+        """
+        from src.time_reclamation.infrastructure.llm import LLMStatus
+        
+        self.logger.print_section("GENERATING RESPONSES")
+        
+        if not llm_manager.is_any_provider_configured():
+            self.logger.print_bullet("⚠️  No LLM provider instances are configured")
+            self.logger.print_bullet("Configure LLM provider instances in config.yml to generate responses")
+            return
+        
+        target_name = f"instance '{instance_name}'" if instance_name else "auto-selected instance"
+        self.logger.print_bullet(f"Using: {target_name}")
+        self.logger.print_bullet(f"Prompts: {len(user_prompts)}")
+        if system_prompt:
+            self.logger.print_bullet(f"System: {system_prompt}")
+        
+        results = llm_manager.generate_batch(user_prompts, instance_name, system_prompt)
+        
+        self.logger.print_section("RESPONSES")
+        for index, (user_prompt, result) in enumerate(zip(user_prompts, results), 1):
+            self.logger.print_bullet(f"[{index}] Prompt: {user_prompt}")
+            if result.status == LLMStatus.SUCCESS:
+                print("\n" + _RULE)
+                print(result.response)
+                print(_RULE + "\n")
+            else:
+                self.logger.print_bullet(f"✗ Failed to generate response: {result.error_details}", indent=4)
+    
     def validate_args(self, args: List[str]) -> bool:
         """
         Validate command arguments.
@@ -217,26 +313,8 @@ class LLMCommand(BaseCommand):
         """Show help information for this command."""
         super().show_help()
         
-        self.logger.print_section("OPTIONS")
-        self.logger.print_bullet("<instance_name>      Specify which LLM provider instance to use")
-        self.logger.print_bullet("--prompt <text>      The prompt to send to the LLM (required for generation)")
-        self.logger.print_bullet("--system <text>      System prompt to set context/behavior (optional)")
-        self.logger.print_bullet("--list               Show LLM provider instances without generating")
-        self.logger.print_bullet("--test [instance]    Test LLM provider connections")
-        self.logger.print_bullet("--help, -h           Show this help message")
-        
-        self.logger.print_section("EXAMPLES")
-        self.logger.print_bullet("python main.py llm --list")
-        self.logger.print_bullet("python main.py llm --test")
-        self.logger.print_bullet("python main.py llm --test local_llama")
-        self.logger.print_bullet("python main.py llm --prompt 'Explain quantum computing'")
-        self.logger.print_bullet("python main.py llm local_llama --prompt 'Write a Python function'")
-        self.logger.print_bullet("python main.py llm --system 'You are a code expert' --prompt 'Fix this bug'")
-        self.logger.print_bullet("python -m time_reclamation ai --prompt 'What is machine learning?'")
-        
-        self.logger.print_section("NOTES")
-        self.logger.print_bullet("This command generates responses using configured LLM provider instances")
-        self.logger.print_bullet("Configure LLM provider instances in config.yml before using")
-        self.logger.print_bullet("Without instance name, the first available instance is used")
-        self.logger.print_bullet("System prompts help set the AI's behavior and context")
-        self.logger.print_bullet("Use aliases 'ai' or 'generate' as shortcuts for 'llm'")
\ No newline at end of file
+        use_colors = self.logger.use_colors
+        help_text = _LLM_HELP_CACHE.get(use_colors)
+        if help_text is None:
+            help_text = _LLM_HELP_CACHE[use_colors] = self.logger.render_sections(_LLM_HELP_SECTIONS)
+        self.logger.print_block(help_text)
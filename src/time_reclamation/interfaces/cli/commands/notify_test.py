@@ -1,8 +1,42 @@
 """Notification test command implementation."""
 
-from typing import List
-from .base import BaseCommand
-from src.time_reclamation.infrastructure.notifications import get_notification_manager, NotificationStatus
+from functools import cached_property
+from typing import Any, List
+from .base import BaseCommand, CommandArgumentError, create_argument_parser
+
+
+# Help sections rendered once per color mode and written in a single call
+_NOTIFY_TEST_HELP_SECTIONS = (
+    ("OPTIONS", (
+        "<instance_name>      Specify which provider instance to test",
+        "--message <text>     Send a custom test message",
+        "--list               Show provider instances without testing",
+        "--test               Test connections without sending a message",
+        "--all                Send the test message through every configured instance",
+        "--status             Show status and connection tests as one health table",
+        "--help, -h           Show this help message",
+    )),
+    ("EXAMPLES", (
+        "python main.py notify-test",
+        "python main.py notify-test work_bot",
+        "python main.py notify-test personal_bot --message 'Hello from TimeReclamation!'",
+        "python main.py notify-test --list",
+        "python main.py notify-test --test",
+        "python main.py notify-test --all",
+        "python main.py notify-test --status",
+        "python -m time_reclamation notification-test work_bot",
+    )),
+    ("NOTES", (
+        "This command tests configured notification provider instances",
+        "Configure provider instances in config.yml before running tests",
+        "Without instance name, all instances are tested",
+        "With instance name, only that instance is tested",
+        "Instances that receive the test message are not tested separately",
+    )),
+)
+_NOTIFY_TEST_HELP_CACHE = {}
+
+_DEFAULT_TEST_MESSAGE = "🚀 Test message from Time Reclamation App!\n\nThis is a test to verify that notifications are working correctly."
 
 
 class NotifyTestCommand(BaseCommand):
@@ -26,7 +60,52 @@ class NotifyTestCommand(BaseCommand):
     @property
     def usage(self) -> str:
         """Return command usage string."""
-        return f"python -m time_reclamation {self.name} [<instance_name>] [--message 'Custom message'] [--list]"
+        return f"python -m time_reclamation {self.name} [<instance_name>] [--message 'Custom message'] [--list] [--test] [--all] [--status]"
+    
+    @classmethod
+    def _build_parser(cls) -> Any:
+        """Build the notify-test command argument parser."""
+        parser = create_argument_parser("notify-test")
+        parser.add_argument("instance_name", nargs="?")
+        # Older --provider <name> form, kept as an alias for the instance name
+        parser.add_argument("--provider", dest="provider")
+        parser.add_argument("--message", dest="custom_message")
+        parser.add_argument("--list", dest="list_only", action="store_true")
+        parser.add_argument("--test", dest="test_only", action="store_true")
+        parser.add_argument("--status", dest="status_only", action="store_true")
+        parser.add_argument("--all", dest="send_all", action="store_true")
+        parser.add_argument("--help", "-h", dest="help", action="store_true")
+        return parser
+    
+    @cached_property
+    def _manager(self):
+        """The notification manager, resolved once per command instance."""
+        # Imported here so loading the command (e.g. for --help) skips the provider stack
+        from src.time_reclamation.infrastructure.notifications import get_notification_manager
+        return get_notification_manager()
+    
+    def parse_args(self, args: List[str]) -> Any:
+        """
+        Parse command line arguments, folding --provider into the instance name.
+        
+        Args:
+            args: Command line arguments
+            
+        Returns:
+            argparse.Namespace: Parsed arguments
+            
+        Raises:
+            CommandArgumentError: If the arguments are invalid, or a positional
+                instance name and --provider name different instances
+        """
+        parsed = super().parse_args(args)
+        if parsed.provider:
+            if parsed.instance_name and parsed.instance_name != parsed.provider:
+                raise CommandArgumentError(
+                    f"conflicting instance names '{parsed.instance_name}' and --provider '{parsed.provider}'"
+                )
+            parsed.instance_name = parsed.provider
+        return parsed
     
     def execute(self, args: List[str]) -> int:
         """
@@ -40,51 +119,52 @@ class NotifyTestCommand(BaseCommand):
         """
         try:
             # Parse arguments
-            instance_name = None
-            custom_message = None
-            list_only = False
-            
-            i = 0
-            while i < len(args):
-                if args[i] == "--message" and i + 1 < len(args):
-                    custom_message = args[i + 1]
-                    i += 2
-                elif args[i] == "--list":
-                    list_only = True
-                    i += 1
-                elif args[i] in ["--help", "-h"]:
-                    self.show_help()
-                    return 0
-                elif not args[i].startswith("--"):
-                    # First non-flag argument is the instance name
-                    if instance_name is None:
-                        instance_name = args[i]
-                        i += 1
-                    else:
-                        return self.handle_error(f"Unexpected argument: {args[i]}")
-                else:
-                    return self.handle_error(f"Unknown argument: {args[i]}")
+            try:
+                parsed = self.parse_args(args)
+            except CommandArgumentError as e:
+                return self.handle_error(f"Invalid arguments: {str(e)}")
+            
+            if parsed.help:
+                self.show_help()
+                return 0
+            
+            instance_name = parsed.instance_name
+            custom_message = parsed.custom_message
+            list_only = parsed.list_only
+            send_all = parsed.send_all
             
             # Get notification manager
-            notification_manager = get_notification_manager()
+            notification_manager = self._manager
             
             # Display header
             self.logger.print_header("Notification System Test")
             
+            # Provider status snapshot, shared by the steps below
+            provider_status = notification_manager.get_provider_status()
+            
+            # Handle health check
+            if parsed.status_only:
+                from src.time_reclamation.infrastructure.notifications import NotificationStatus
+                self.show_health(notification_manager, provider_status, NotificationStatus.SUCCESS, instance_name)
+                return self.handle_success()
+            
             # Show provider status
-            self._show_provider_status(notification_manager)
+            self._show_provider_status(provider_status)
             
             # If list only, skip testing
             if list_only:
                 return self.handle_success()
             
-            # Test connections
-            self._test_provider_connections(notification_manager, instance_name)
+            # Test connections only
+            if parsed.test_only:
+                self._test_provider_connections(notification_manager, instance_name)
+                return self.handle_success()
             
-            # Send test message if any provider is configured
-            if notification_manager.is_any_provider_configured():
-                self._send_test_message(notification_manager, instance_name, custom_message)
+            # Send test message if any provider is configured; the send doubles as its connection test
+            if any(status['available'] for status in provider_status.values()):
+                self._test_and_send(notification_manager, instance_name, custom_message, send_all)
             else:
+                self._test_provider_connections(notification_manager, instance_name)
                 self.logger.print_section("TEST MESSAGE")
                 self.logger.print_bullet("⚠️  No provider instances are configured - skipping test message")
                 self.logger.print_bullet("Configure provider instances in config.yml to send test messages")
@@ -94,33 +174,24 @@ class NotifyTestCommand(BaseCommand):
         except Exception as e:
             return self.handle_error(f"Failed to test notifications: {str(e)}")
     
-    def _show_provider_status(self, notification_manager) -> None:
+    def _show_provider_status(self, provider_status) -> None:
         """
         Show the status of all notification provider instances.
         
         Args:
-            notification_manager: Notification manager instance
+            provider_status: Status snapshot from the manager's get_provider_status()
         """
-        self.logger.print_section("PROVIDER INSTANCES STATUS")
-        
-        provider_status = notification_manager.get_provider_status()
-        
-        if not provider_status:
-            self.logger.print_bullet("No provider instances configured")
-            return
-        
-        for instance_name, status in provider_status.items():
-            name = status['name']
-            provider_type = status['type']
-            configured = status['configured']
-            available = status['available']
-            
-            if configured and available:
-                self.logger.print_bullet(f"✓ {instance_name} ({provider_type}): {name} - Configured and available")
-            elif configured:
-                self.logger.print_bullet(f"⚠️  {instance_name} ({provider_type}): {name} - Configured but not available")
-            else:
-                self.logger.print_bullet(f"✗ {instance_name} ({provider_type}): {name} - Not configured")
+        with self.logger.buffered():
+            self.logger.print_section("PROVIDER INSTANCES STATUS")
+            
+            if not provider_status:
+                self.logger.print_bullet("No provider instances configured")
+                return
+            
+            self.logger.print_bullets(
+                self.format_provider_status(instance_name, status)
+                for instance_name, status in provider_status.items()
+            )
     
     def _test_provider_connections(self, notification_manager, instance_name=None) -> None:
         """
@@ -132,45 +203,64 @@ class NotifyTestCommand(BaseCommand):
         """
         self.logger.print_section("CONNECTION TESTS")
         
-        test_results = notification_manager.test_providers(instance_name)
+        # Results are printed as each test completes
+        test_results = notification_manager.test_providers(instance_name, on_result=self._print_test_result)
         
         if not test_results:
             self.logger.print_bullet("No provider instances to test")
-            return
+    
+    def _print_test_result(self, instance_name: str, result) -> None:
+        """
+        Print the result of a single connection test.
         
-        for instance_name, result in test_results.items():
-            if result.status == NotificationStatus.SUCCESS:
-                self.logger.print_bullet(f"✓ {instance_name}: {result.message}")
-            else:
-                self.logger.print_bullet(f"✗ {instance_name}: {result.error_details}")
+        Args:
+            instance_name: Name of the tested instance
+            result: Test result for the instance
+        """
+        from src.time_reclamation.infrastructure.notifications import NotificationStatus
+        
+        if result.status == NotificationStatus.SUCCESS:
+            self.logger.print_bullet(f"✓ {instance_name}: {result.message}")
+        else:
+            self.logger.print_bullet(f"✗ {instance_name}: {result.error_details}")
     
-    def _send_test_message(self, notification_manager, instance_name=None, custom_message=None) -> None:
+    def _test_and_send(self, notification_manager, instance_name=None, custom_message=None, send_all=False) -> None:
         """
-        Send a test message using the notification system.
+        Send a test message and test the remaining provider instances concurrently.
         
         Args:
             notification_manager: Notification manager instance
             instance_name: Specific instance to use (optional)
             custom_message: Custom message to send (optional)
+            send_all: Send through every configured instance concurrently
         """
-        self.logger.print_section("TEST MESSAGE")
+        self.logger.print_section("CONNECTION TESTS AND TEST MESSAGE")
         
-        # Prepare test message
-        if custom_message:
-            message = custom_message
-        else:
-            message = "🚀 Test message from Time Reclamation App!\n\nThis is a test to verify that notifications are working correctly."
+        # Results are printed as each send or test completes
+        notification_manager.test_and_send(
+            custom_message or _DEFAULT_TEST_MESSAGE,
+            instance_name=instance_name,
+            send_all=send_all,
+            on_test_result=self._print_test_result,
+            on_send_result=self._print_send_result,
+        )
+    
+    def _print_send_result(self, instance_name: str, result) -> None:
+        """
+        Print the result of a test message sent through one instance.
         
-        # Send the message
-        result = notification_manager.send_message(message, instance_name)
+        Args:
+            instance_name: Name of the instance used
+            result: Send result for the instance
+        """
+        from src.time_reclamation.infrastructure.notifications import NotificationStatus
         
         if result.status == NotificationStatus.SUCCESS:
-            target_name = "auto-selected instance" if instance_name is None else f"instance '{instance_name}'"
-            self.logger.print_bullet(f"✓ Test message sent successfully via {target_name}")
+            self.logger.print_bullet(f"✓ Test message sent successfully via instance '{instance_name}'")
             if result.message:
-                self.logger.print_bullet(f"Response: {result.message}")
+                self.logger.print_bullet(f"Response: {result.message}", indent=4)
         else:
-            self.logger.print_bullet(f"✗ Failed to send test message: {result.error_details}")
+            self.logger.print_bullet(f"✗ Failed to send test message via instance '{instance_name}': {result.error_details}")
     
     def validate_args(self, args: List[str]) -> bool:
         """
@@ -189,21 +279,8 @@ class NotifyTestCommand(BaseCommand):
         """Show help information for this command."""
         super().show_help()
         
-        self.logger.print_section("OPTIONS")
-        self.logger.print_bullet("<instance_name>      Specify which provider instance to test")
-        self.logger.print_bullet("--message <text>     Send a custom test message")
-        self.logger.print_bullet("--list               Show provider instances without testing")
-        self.logger.print_bullet("--help, -h           Show this help message")
-        
-        self.logger.print_section("EXAMPLES")
-        self.logger.print_bullet("python main.py notify-test")
-        self.logger.print_bullet("python main.py notify-test work_bot")
-        self.logger.print_bullet("python main.py notify-test personal_bot --message 'Hello from TimeReclamation!'")
-        self.logger.print_bullet("python main.py notify-test --list")
-        self.logger.print_bullet("python -m time_reclamation notification-test work_bot")
-        
-        self.logger.print_section("NOTES")
-        self.logger.print_bullet("This command tests configured notification provider instances")
-        self.logger.print_bullet("Configure provider instances in config.yml before running tests")
-        self.logger.print_bullet("Without instance name, all instances are tested")
-        self.logger.print_bullet("With instance name, only that instance is tested")
\ No newline at end of file
+        use_colors = self.logger.use_colors
+        help_text = _NOTIFY_TEST_HELP_CACHE.get(use_colors)
+        if help_text is None:
+            help_text = _NOTIFY_TEST_HELP_CACHE[use_colors] = self.logger.render_sections(_NOTIFY_TEST_HELP_SECTIONS)
+        self.logger.print_block(help_text)
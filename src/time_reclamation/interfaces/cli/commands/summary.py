@@ -1,32 +1,12 @@
 """Summary command for processing video transcripts into audio summaries."""
 
-from typing import List
-from .base import BaseCommand
-from src.time_reclamation.core.youtube import get_summary_service
+from functools import cached_property
+from typing import Any, List
+from .base import BaseCommand, CommandArgumentError, HELP_FLAGS, create_argument_parser
 
 
-class SummaryCommand(BaseCommand):
-    """Command for processing video summaries."""
-    
-    @property
-    def name(self) -> str:
-        """Return the command name."""
-        return "summary"
-    
-    @property
-    def description(self) -> str:
-        """Return the command description."""
-        return "Process video transcripts into audio summaries and deliver via notifications"
-    
-    @property
-    def aliases(self) -> List[str]:
-        """Return command aliases."""
-        return ["sum"]
-    
-    @property
-    def usage(self) -> str:
-        """Return command usage string."""
-        return """python -m time_reclamation summary <subcommand> [options]
+# Usage text shown in help, built once at import
+_SUMMARY_USAGE = """python -m time_reclamation summary <subcommand> [options]
         
         SUBCOMMANDS:
           process [channel_name]    - Process summaries for all or specific channel
@@ -51,6 +31,55 @@ class SummaryCommand(BaseCommand):
           python -m time_reclamation summary status
           python -m time_reclamation summary retry
           python -m time_reclamation summary cleanup --max-age 48"""
+
+
+class SummaryCommand(BaseCommand):
+    """Command for processing video summaries."""
+    
+    # Subcommand name -> handler method, shared by all instances
+    _SUBCOMMANDS = {
+        "process": "_handle_process",
+        "status": "_handle_status",
+        "retry": "_handle_retry",
+        "cleanup": "_handle_cleanup",
+    }
+    
+    # Command metadata (constant, so plain class attributes)
+    name = "summary"
+    description = "Process video transcripts into audio summaries and deliver via notifications"
+    aliases = ("sum",)
+    usage = _SUMMARY_USAGE
+    
+    @classmethod
+    def _build_parser(cls) -> Any:
+        """Build the summary command argument parser, one subparser per subcommand."""
+        parser = create_argument_parser("summary")
+        subparsers = parser.add_subparsers(dest="subcommand")
+        
+        process = subparsers.add_parser("process", add_help=False, allow_abbrev=False)
+        process.add_argument("channel_name", nargs="?")
+        process.add_argument("--video", dest="video_url")
+        process.add_argument("--limit", type=int)
+        process.add_argument("--force", action="store_true")
+        process.add_argument("--no-scrape", dest="scrape_first", action="store_false")
+        
+        status = subparsers.add_parser("status", add_help=False, allow_abbrev=False)
+        status.add_argument("channel_name", nargs="?")
+        
+        retry = subparsers.add_parser("retry", add_help=False, allow_abbrev=False)
+        retry.add_argument("--limit", type=int)
+        
+        cleanup = subparsers.add_parser("cleanup", add_help=False, allow_abbrev=False)
+        cleanup.add_argument("--max-age", dest="max_age", type=int, default=24)
+        
+        return parser
+    
+    @cached_property
+    def _summary_service(self):
+        """The summary service, resolved once per command instance."""
+        # Imported here so loading the command (e.g. for --help) skips the YouTube stack
+        from src.time_reclamation.core.youtube import get_summary_service
+        return get_summary_service()
     
     def execute(self, args: List[str]) -> int:
         """
@@ -63,103 +92,83 @@ class SummaryCommand(BaseCommand):
             Exit code (0 for success, non-zero for error)
         """
         try:
-            if not args or args[0] in ["--help", "-h", "help"]:
+            if not args or args[0] in HELP_FLAGS:
                 self.show_help()
                 return 0
             
-            subcommand = args[0].lower()
-            subcommand_args = args[1:] if len(args) > 1 else []
-            
             # Route to appropriate subcommand
-            if subcommand == "process":
-                return self._handle_process(subcommand_args)
-            elif subcommand == "status":
-                return self._handle_status(subcommand_args)
-            elif subcommand == "retry":
-                return self._handle_retry(subcommand_args)
-            elif subcommand == "cleanup":
-                return self._handle_cleanup(subcommand_args)
-            else:
+            subcommand, handler = self.find_subcommand(args[0])
+            if handler is None:
                 return self.handle_error(f"Unknown subcommand: {subcommand}")
+            
+            try:
+                options = self.parse_args([subcommand, *args[1:]])
+            except CommandArgumentError as e:
+                return self.handle_error(f"Invalid arguments: {str(e)}")
+            
+            return handler(options)
                 
         except Exception as e:
             return self.handle_error(f"Summary command failed: {str(e)}")
     
-    def _handle_process(self, args: List[str]) -> int:
+    def _handle_process(self, options: Any) -> int:
         """Handle the process subcommand."""
         try:
-            summary_service = get_summary_service()
-            
-            # Parse arguments
-            channel_name = None
-            video_url = None
-            limit = None
-            force = False
-            scrape_first = True  # Default to scraping first
+            summary_service = self._summary_service
             
-            i = 0
-            while i < len(args):
-                if args[i] == "--video" and i + 1 < len(args):
-                    video_url = args[i + 1]
-                    i += 2
-                elif args[i] == "--limit" and i + 1 < len(args):
-                    try:
-                        limit = int(args[i + 1])
-                    except ValueError:
-                        return self.handle_error("Limit must be a number")
-                    i += 2
-                elif args[i] == "--force":
-                    force = True
-                    i += 1
-                elif args[i] == "--no-scrape":
-                    scrape_first = False
-                    i += 1
-                elif not args[i].startswith("--"):
-                    channel_name = args[i]
-                    i += 1
-                else:
-                    return self.handle_error(f"Unknown option: {args[i]}")
+            channel_name = options.channel_name
+            video_url = options.video_url
+            limit = options.limit
+            force = options.force
+            scrape_first = options.scrape_first  # Defaults to scraping first
             
             # Process specific video
             if video_url:
-                self.logger.info(f"Processing summary for video: {video_url}")
+                self.logger.info("Processing summary for video: %s", video_url)
                 result = summary_service.process_video_summary(video_url)
                 
                 if result.get('success'):
-                    self.logger.print_header("Video Summary Processed")
-                    self.logger.print_bullet(f"Title: {result.get('video_title', 'Unknown')}")
-                    self.logger.print_bullet(f"Summary length: {result.get('summary_length', 0)} characters")
+                    with self.logger.buffered():
+                        self.logger.print_header("Video Summary Processed")
+                        self.logger.print_bullets((
+                            f"Title: {result.get('video_title', 'Unknown')}",
+                            f"Summary length: {result.get('summary_length', 0)} characters",
+                        ))
                     return self.handle_success("Video summary processed successfully")
                 else:
                     error = result.get('error', 'Unknown error')
                     if result.get('skipped'):
-                        self.logger.warning(f"Video skipped: {error}")
+                        self.logger.warning("Video skipped: %s", error)
                         return 0
                     return self.handle_error(f"Failed to process video: {error}")
             
             # Process channel(s)
-            self.logger.info(f"Processing summaries for: {channel_name or 'all enabled channels'}")
+            self.logger.info("Processing summaries for: %s", channel_name or 'all enabled channels')
             if scrape_first:
                 self.logger.info("Will scrape for new videos before processing summaries")
             results = summary_service.process_channel_summaries(channel_name, limit, force, scrape_first)
             
-            if 'error' in results:
-                return self.handle_error(results['error'])
-            
-            self.logger.print_header("Summary Processing Results")
-            self.logger.print_bullet(f"Processed: {results['processed']}")
-            self.logger.print_bullet(f"Failed: {results['failed']}")
-            self.logger.print_bullet(f"Skipped: {results['skipped']}")
-            
-            # Show per-channel results
-            if results.get('channel_results'):
-                self.logger.print_section("PER-CHANNEL RESULTS")
-                for channel_result in results['channel_results']:
-                    self.logger.print_bullet(
+            error = results.get('error')
+            if error is not None:
+                return self.handle_error(error)
+            
+            with self.logger.buffered():
+                self.logger.print_header("Summary Processing Results")
+                self.logger.print_bullets((
+                    f"Processed: {results['processed']}",
+                    f"Failed: {results['failed']}",
+                    f"Skipped: {results['skipped']}",
+                ))
+                
+                # Show per-channel results
+                if results.get('channel_results'):
+                    self.logger.print_section("PER-CHANNEL RESULTS")
+                    self.logger.print_bullets(
                         f"{channel_result['channel_name']}: "
                         f"{channel_result['processed']} processed, "
                         f"{channel_result['failed']} failed, "
                         f"{channel_result['skipped']} skipped"
+                        for channel_result in results['channel_results']
                     )
             
             return self.handle_success("Summary processing completed")
@@ -167,10 +176,10 @@ class SummaryCommand(BaseCommand):
         except Exception as e:
             return self.handle_error(f"Processing failed: {str(e)}")
     
-    def _handle_status(self, args: List[str]) -> int:
+    def _handle_status(self, options: Any) -> int:
         """Handle the status subcommand."""
         try:
-            summary_service = get_summary_service()
+            summary_service = self._summary_service
             
             # Get summary statistics
             stats = summary_service.get_summary_stats()
@@ -178,78 +187,61 @@ class SummaryCommand(BaseCommand):
             if not stats:
                 return self.handle_error("Failed to get summary statistics")
             
-            self.logger.print_header("Summary Processing Statistics")
-            self.logger.print_bullet(f"Total videos with transcripts: {stats.get('total_with_transcripts', 0)}")
-            self.logger.print_bullet(f"Summaries processed: {stats.get('summary_processed', 0)}")
-            self.logger.print_bullet(f"Pending summaries: {stats.get('pending_summaries', 0)}")
-            self.logger.print_bullet(f"Failed summaries: {stats.get('summary_errors', 0)}")
+            with self.logger.buffered():
+                self.logger.print_header("Summary Processing Statistics")
+                self.logger.print_bullets((
+                    f"Total videos with transcripts: {stats.get('total_with_transcripts', 0)}",
+                    f"Summaries processed: {stats.get('summary_processed', 0)}",
+                    f"Pending summaries: {stats.get('pending_summaries', 0)}",
+                    f"Failed summaries: {stats.get('summary_errors', 0)}",
+                ))
             
             return self.handle_success()
             
         except Exception as e:
             return self.handle_error(f"Failed to get status: {str(e)}")
     
-    def _handle_retry(self, args: List[str]) -> int:
+    def _handle_retry(self, options: Any) -> int:
         """Handle the retry subcommand."""
         try:
-            summary_service = get_summary_service()
-            
-            # Parse arguments
-            limit = None
-            
-            i = 0
-            while i < len(args):
-                if args[i] == "--limit" and i + 1 < len(args):
-                    try:
-                        limit = int(args[i + 1])
-                    except ValueError:
-                        return self.handle_error("Limit must be a number")
-                    i += 2
-                else:
-                    return self.handle_error(f"Unknown option: {args[i]}")
+            summary_service = self._summary_service
+            limit = options.limit
             
             self.logger.info("Retrying failed summaries")
             results = summary_service.retry_failed_summaries(limit)
             
-            if 'error' in results:
-                return self.handle_error(results['error'])
+            error = results.get('error')
+            if error is not None:
+                return self.handle_error(error)
             
-            self.logger.print_header("Retry Results")
-            self.logger.print_bullet(f"Processed: {results['processed']}")
-            self.logger.print_bullet(f"Failed: {results['failed']}")
+            with self.logger.buffered():
+                self.logger.print_header("Retry Results")
+                self.logger.print_bullets((
+                    f"Processed: {results['processed']}",
+                    f"Failed: {results['failed']}",
+                ))
             
             return self.handle_success(results.get('message', 'Retry completed'))
             
         except Exception as e:
             return self.handle_error(f"Retry failed: {str(e)}")
     
-    def _handle_cleanup(self, args: List[str]) -> int:
+    def _handle_cleanup(self, options: Any) -> int:
         """Handle the cleanup subcommand."""
         try:
-            summary_service = get_summary_service()
-            
-            # Parse arguments
-            max_age = 24  # Default 24 hours
-            
-            i = 0
-            while i < len(args):
-                if args[i] == "--max-age" and i + 1 < len(args):
-                    try:
-                        max_age = int(args[i + 1])
-                    except ValueError:
-                        return self.handle_error("Max age must be a number")
-                    i += 2
-                else:
-                    return self.handle_error(f"Unknown option: {args[i]}")
+            summary_service = self._summary_service
+            max_age = options.max_age  # Defaults to 24 hours
             
-            self.logger.info(f"Cleaning up audio files older than {max_age} hours")
+            self.logger.info("Cleaning up audio files older than %s hours", max_age)
             results = summary_service.cleanup_audio_files(max_age)
             
-            if 'error' in results:
-                return self.handle_error(results['error'])
+            error = results.get('error')
+            if error is not None:
+                return self.handle_error(error)
             
-            self.logger.print_header("Cleanup Results")
-            self.logger.print_bullet(f"Removed files: {results['removed_files']}")
+            with self.logger.buffered():
+                self.logger.print_header("Cleanup Results")
+                self.logger.print_bullet(f"Removed files: {results['removed_files']}")
             
             return self.handle_success(results.get('message', 'Cleanup completed'))
             
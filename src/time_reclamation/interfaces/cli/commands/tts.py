@@ -1,32 +1,70 @@
 """TTS command implementation."""
 
-from typing import List
-from .base import BaseCommand
-from src.time_reclamation.infrastructure.tts import get_tts_manager, TTSStatus
+from functools import cached_property
+from typing import Any, List
+from .base import BaseCommand, CommandArgumentError, create_argument_parser
+
+
+# Help sections rendered once per color mode and written in a single call
+_TTS_HELP_SECTIONS = (
+    ("OPTIONS", (
+        "<instance_name>      Specify which TTS provider instance to use",
+        "--text <text>        The text to convert to speech (required for generation)",
+        "--output <filename>  Output filename (optional, auto-generates if not provided)",
+        "--list               Show TTS provider instances without generating",
+        "--test [instance]    Test TTS provider connections",
+        "--quiet, -q          Skip the provider status listing",
+        "--help, -h           Show this help message",
+    )),
+    ("EXAMPLES", (
+        "python main.py tts --list",
+        "python main.py tts --test",
+        "python main.py tts --test piper_english",
+        "python main.py tts --text 'Hello, world!'",
+        "python main.py tts --text 'Hello, world!' --output greeting.wav",
+        "python main.py tts piper_english --text 'This is a test'",
+        "python -m time_reclamation speak --text 'Using alias command'",
+    )),
+    ("NOTES", (
+        "This command generates speech from text using configured TTS provider instances",
+        "Configure TTS provider instances in config.yml before using",
+        "Without instance name, the first available instance is used",
+        "Output files are saved to the configured output directory (default: cache_data/tts)",
+        "Use aliases 'speak' or 'voice' as shortcuts for 'tts'",
+    )),
+)
+_TTS_HELP_CACHE = {}
 
 
 class TTSCommand(BaseCommand):
     """Command to interact with TTS providers and generate speech."""
     
-    @property
-    def name(self) -> str:
-        """Return the command name."""
-        return "tts"
-    
-    @property
-    def description(self) -> str:
-        """Return the command description."""
-        return "Generate speech from text using TTS providers"
+    # Command metadata (constant, so plain class attributes)
+    name = "tts"
+    description = "Generate speech from text using TTS providers"
+    aliases = ("speak", "voice")
+    usage = "python -m time_reclamation tts [<instance_name>] --text 'Your text' [--output filename.wav] [--list] [--test] [--quiet]"
     
-    @property
-    def aliases(self) -> List[str]:
-        """Return command aliases."""
-        return ["speak", "voice"]
+    @classmethod
+    def _build_parser(cls) -> Any:
+        """Build the tts command argument parser."""
+        parser = create_argument_parser("tts")
+        parser.add_argument("instance_name", nargs="?")
+        parser.add_argument("--text")
+        parser.add_argument("--output", dest="output_filename")
+        parser.add_argument("--list", dest="list_only", action="store_true")
+        # --test takes an optional instance name; bare --test stores ""
+        parser.add_argument("--test", nargs="?", const="", default=None)
+        parser.add_argument("--quiet", "-q", dest="quiet", action="store_true")
+        parser.add_argument("--help", "-h", dest="help", action="store_true")
+        return parser
     
-    @property
-    def usage(self) -> str:
-        """Return command usage string."""
-        return f"python -m time_reclamation {self.name} [<instance_name>] --text 'Your text' [--output filename.wav] [--list] [--test]"
+    @cached_property
+    def _manager(self):
+        """The TTS manager, resolved once per command instance."""
+        # Imported here so loading the command (e.g. for --help) skips the TTS backends
+        from src.time_reclamation.infrastructure.tts import get_tts_manager
+        return get_tts_manager()
     
     def execute(self, args: List[str]) -> int:
         """
@@ -40,53 +78,34 @@ class TTSCommand(BaseCommand):
         """
         try:
             # Parse arguments
-            instance_name = None
-            text = None
-            output_filename = None
-            list_only = False
-            test_only = False
-            test_instance = None
-            
-            i = 0
-            while i < len(args):
-                if args[i] == "--text" and i + 1 < len(args):
-                    text = args[i + 1]
-                    i += 2
-                elif args[i] == "--output" and i + 1 < len(args):
-                    output_filename = args[i + 1]
-                    i += 2
-                elif args[i] == "--list":
-                    list_only = True
-                    i += 1
-                elif args[i] == "--test":
-                    test_only = True
-                    # Check if next arg is an instance name
-                    if i + 1 < len(args) and not args[i + 1].startswith("--"):
-                        test_instance = args[i + 1]
-                        i += 2
-                    else:
-                        i += 1
-                elif args[i] in ["--help", "-h"]:
-                    self.show_help()
-                    return 0
-                elif not args[i].startswith("--"):
-                    # First non-flag argument is the instance name
-                    if instance_name is None:
-                        instance_name = args[i]
-                        i += 1
-                    else:
-                        return self.handle_error(f"Unexpected argument: {args[i]}")
-                else:
-                    return self.handle_error(f"Unknown argument: {args[i]}")
+            try:
+                parsed = self.parse_args(args)
+            except CommandArgumentError as e:
+                return self.handle_error(f"Invalid arguments: {str(e)}")
+            
+            if parsed.help:
+                self.show_help()
+                return 0
+            
+            instance_name = parsed.instance_name
+            text = parsed.text
+            output_filename = parsed.output_filename
+            list_only = parsed.list_only
+            test_only = parsed.test is not None
+            test_instance = parsed.test or None
             
             # Get TTS manager
-            tts_manager = get_tts_manager()
+            tts_manager = self._manager
             
             # Display header
             self.logger.print_header("TTS System")
             
+            # Provider status snapshot, shared by the steps below
+            provider_status = tts_manager.get_provider_status()
+            
             # Show provider status
-            self._show_provider_status(tts_manager)
+            if not parsed.quiet or list_only:
+                self._show_provider_status(provider_status)
             
             # Handle list only
             if list_only:
@@ -94,7 +113,7 @@ class TTSCommand(BaseCommand):
             
             # Handle test only
             if test_only:
-                self._test_provider_connections(tts_manager, test_instance)
+                self._test_provider_connections(tts_manager, provider_status, test_instance)
                 return self.handle_success()
             
             # Generate speech
@@ -107,60 +126,55 @@ class TTSCommand(BaseCommand):
         except Exception as e:
             return self.handle_error(f"Failed to execute TTS command: {str(e)}")
     
-    def _show_provider_status(self, tts_manager) -> None:
+    def _show_provider_status(self, provider_status) -> None:
         """
         Show the status of all TTS provider instances.
         
         Args:
-            tts_manager: TTS manager instance
+            provider_status: Status snapshot from the manager's get_provider_status()
         """
-        self.logger.print_section("TTS PROVIDER INSTANCES STATUS")
-        
-        provider_status = tts_manager.get_provider_status()
-        
-        if not provider_status:
-            self.logger.print_bullet("No TTS provider instances configured")
-            return
-        
-        for instance_name, status in provider_status.items():
-            name = status['name']
-            provider_type = status['type']
-            configured = status['configured']
-            available = status['available']
-            
-            if configured and available:
-                self.logger.print_bullet(f"✓ {instance_name} ({provider_type}): {name} - Configured and available")
-            elif configured:
-                self.logger.print_bullet(f"⚠️  {instance_name} ({provider_type}): {name} - Configured but not available")
-            else:
-                self.logger.print_bullet(f"✗ {instance_name} ({provider_type}): {name} - Not configured")
+        with self.logger.buffered():
+            self.logger.print_section("TTS PROVIDER INSTANCES STATUS")
+            
+            if not provider_status:
+                self.logger.print_bullet("No TTS provider instances configured")
+                return
+            
+            self.logger.print_bullets(
+                self.format_provider_status(instance_name, status)
+                for instance_name, status in provider_status.items()
+            )
     
-    def _test_provider_connections(self, tts_manager, instance_name=None) -> None:
+    def _test_provider_connections(self, tts_manager, provider_status, instance_name=None) -> None:
         """
         Test connections to TTS provider instances.
         
         Args:
             tts_manager: TTS manager instance
+            provider_status: Status snapshot from the manager's get_provider_status()
             instance_name: Specific instance to test (optional, tests all if not provided)
         """
-        self.logger.print_section("CONNECTION TESTS")
+        from src.time_reclamation.infrastructure.tts import TTSStatus
         
-        test_results = tts_manager.test_providers(instance_name)
+        test_results = tts_manager.test_providers(instance_name, provider_status)
         
-        if not test_results:
-            self.logger.print_bullet("No TTS provider instances to test")
-            return
-        
-        for instance_name, result in test_results.items():
-            if result.status == TTSStatus.SUCCESS:
-                response_info = result.provider_response.get('message', 'Connection successful') if result.provider_response else 'Connection successful'
-                self.logger.print_bullet(f"✓ {instance_name}: {response_info}")
-                if result.generation_time:
-                    self.logger.print_bullet(f"  Generation time: {result.generation_time:.2f}s", indent=4)
-                if result.audio_duration:
-                    self.logger.print_bullet(f"  Test audio duration: {result.audio_duration:.2f}s", indent=4)
-            else:
-                self.logger.print_bullet(f"✗ {instance_name}: {result.error_details}")
+        with self.logger.buffered():
+            self.logger.print_section("CONNECTION TESTS")
+            
+            if not test_results:
+                self.logger.print_bullet("No TTS provider instances to test")
+                return
+            
+            for instance_name, result in test_results.items():
+                if result.status == TTSStatus.SUCCESS:
+                    response_info = result.provider_response.get('message', 'Connection successful') if result.provider_response else 'Connection successful'
+                    self.logger.print_bullet(f"✓ {instance_name}: {response_info}")
+                    if result.generation_time:
+                        self.logger.print_bullet(f"  Generation time: {result.generation_time:.2f}s", indent=4)
+                    if result.audio_duration:
+                        self.logger.print_bullet(f"  Test audio duration: {result.audio_duration:.2f}s", indent=4)
+                else:
+                    self.logger.print_bullet(f"✗ {instance_name}: {result.error_details}")
     
     def _generate_speech(self, tts_manager, instance_name=None, text=None, output_filename=None) -> None:
         """
@@ -172,6 +186,8 @@ class TTSCommand(BaseCommand):
             text: Text to convert to speech
             output_filename: Output filename (optional)
         """
+        from src.time_reclamation.infrastructure.tts import TTSStatus
+        
         self.logger.print_section("GENERATING SPEECH")
         
         if not tts_manager.is_any_provider_configured():
@@ -182,7 +198,8 @@ class TTSCommand(BaseCommand):
         # Show what we're doing
         target_name = f"instance '{instance_name}'" if instance_name else "auto-selected instance"
         self.logger.print_bullet(f"Using: {target_name}")
-        self.logger.print_bullet(f"Text: {text[:100]}{'...' if len(text) > 100 else ''}")
+        preview = text if len(text) <= 100 else text[:100] + "..."
+        self.logger.print_bullet(f"Text: {preview}")
         if output_filename:
             self.logger.print_bullet(f"Output: {output_filename}")
         
@@ -225,26 +242,8 @@ class TTSCommand(BaseCommand):
         """Show help information for this command."""
         super().show_help()
         
-        self.logger.print_section("OPTIONS")
-        self.logger.print_bullet("<instance_name>      Specify which TTS provider instance to use")
-        self.logger.print_bullet("--text <text>        The text to convert to speech (required for generation)")
-        self.logger.print_bullet("--output <filename>  Output filename (optional, auto-generates if not provided)")
-        self.logger.print_bullet("--list               Show TTS provider instances without generating")
-        self.logger.print_bullet("--test [instance]    Test TTS provider connections")
-        self.logger.print_bullet("--help, -h           Show this help message")
-        
-        self.logger.print_section("EXAMPLES")
-        self.logger.print_bullet("python main.py tts --list")
-        self.logger.print_bullet("python main.py tts --test")
-        self.logger.print_bullet("python main.py tts --test piper_english")
-        self.logger.print_bullet("python main.py tts --text 'Hello, world!'")
-        self.logger.print_bullet("python main.py tts --text 'Hello, world!' --output greeting.wav")
-        self.logger.print_bullet("python main.py tts piper_english --text 'This is a test'")
-        self.logger.print_bullet("python -m time_reclamation speak --text 'Using alias command'")
-        
-        self.logger.print_section("NOTES")
-        self.logger.print_bullet("This command generates speech from text using configured TTS provider instances")
-        self.logger.print_bullet("Configure TTS provider instances in config.yml before using")
-        self.logger.print_bullet("Without instance name, the first available instance is used")
-        self.logger.print_bullet("Output files are saved to the configured output directory (default: cache_data/tts)")
-        self.logger.print_bullet("Use aliases 'speak' or 'voice' as shortcuts for 'tts'")
\ No newline at end of file
+        use_colors = self.logger.use_colors
+        help_text = _TTS_HELP_CACHE.get(use_colors)
+        if help_text is None:
+            help_text = _TTS_HELP_CACHE[use_colors] = self.logger.render_sections(_TTS_HELP_SECTIONS)
+        self.logger.print_block(help_text)
@@ -8,20 +8,10 @@ from src.time_reclamation.config import get_app_config
 class VersionCommand(BaseCommand):
     """Command to display application version information."""
     
-    @property
-    def name(self) -> str:
-        """Return the command name."""
-        return "version"
-    
-    @property
-    def description(self) -> str:
-        """Return the command description."""
-        return "Display application version and information"
-    
-    @property
-    def aliases(self) -> List[str]:
-        """Return command aliases."""
-        return ["--version", "-v"]
+    # Command metadata (constant, so plain class attributes)
+    name = "version"
+    description = "Display application version and information"
+    aliases = ("--version", "-v")
     
     def execute(self, args: List[str]) -> int:
         """
@@ -34,7 +24,7 @@ class VersionCommand(BaseCommand):
             Exit code (0 for success)
         """
         try:
-            # Get application configuration
+            # Get application configuration (memoized by the config manager)
             app_config = get_app_config()
             
             # Display version information
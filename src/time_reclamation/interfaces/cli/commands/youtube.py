@@ -1,33 +1,15 @@
 """YouTube command for managing YouTube transcript scraping."""
 
-import json
-from typing import List
-from .base import BaseCommand
-from src.time_reclamation.core.youtube import get_youtube_service
+import sys
+from dataclasses import asdict
+from functools import cached_property
+from itertools import islice
+from typing import Any, List, Tuple
+from .base import BaseCommand, HELP_FLAGS
 
 
-class YouTubeCommand(BaseCommand):
-    """Command for YouTube transcript scraping and management."""
-    
-    @property
-    def name(self) -> str:
-        """Return the command name."""
-        return "youtube"
-    
-    @property
-    def description(self) -> str:
-        """Return the command description."""
-        return "Manage YouTube transcript scraping and channel monitoring"
-    
-    @property
-    def aliases(self) -> List[str]:
-        """Return command aliases."""
-        return ["yt"]
-    
-    @property
-    def usage(self) -> str:
-        """Return command usage string."""
-        return """python -m time_reclamation youtube <subcommand> [options]
+# Usage text shown in help, built once at import
+_YOUTUBE_USAGE = """python -m time_reclamation youtube <subcommand> [options]
 
 SUBCOMMANDS:
   scrape [channel_name]     - Scrape all channels or specific channel
@@ -40,12 +22,91 @@ SUBCOMMANDS:
   cleanup                   - Clean up empty cache directories
   help                      - Show this help message
 
+OPTIONS:
+  --json                    - Print stats, channels, unprocessed or cache-stats as JSON
+
 EXAMPLES:
   python -m time_reclamation youtube scrape
   python -m time_reclamation youtube scrape "TechWizard9000"
   python -m time_reclamation youtube stats
   python -m time_reclamation youtube video "https://www.youtube.com/watch?v=VIDEO_ID"
-  python -m time_reclamation youtube unprocessed 10"""
+  python -m time_reclamation youtube unprocessed 10
+  python -m time_reclamation youtube stats --json"""
+
+# Unprocessed videos rendered per write while streaming the listing
+_UNPROCESSED_BATCH_SIZE = 64
+
+# Line templates for the per-channel listings, filled once per channel
+_CHANNEL_STATS_FORMAT = "%s: %d videos, %d with transcripts, %d cache files (%.2f MB)"
+_CHANNEL_STATS_ERROR_FORMAT = "%s: Error - %s"
+_CHANNEL_SCRAPE_FORMAT = "%s: %d new, %d cached, %d errors"
+
+# Subcommands that accept --json
+_JSON_SUBCOMMANDS = frozenset(("stats", "channels", "unprocessed", "cache-stats"))
+
+
+def _split_json_flag(args: List[str]) -> Tuple[List[str], bool]:
+    """
+    Split the --json flag off a subcommand's arguments.
+    
+    Args:
+        args: Subcommand arguments
+        
+    Returns:
+        Tuple of (remaining arguments, whether --json was given)
+    """
+    remaining = [arg for arg in args if arg != "--json"]
+    return remaining, len(remaining) != len(args)
+
+
+def _write_json(data: Any) -> None:
+    """
+    Write data to stdout as a single JSON document.
+    
+    Uses orjson when it is installed and falls back to the standard
+    library otherwise; values JSON can't represent are written as strings.
+    
+    Args:
+        data: JSON-serializable data
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        sys.stdout.write(json.dumps(data, default=str) + "\n")
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, default=str) + b"\n")
+    sys.stdout.flush()
+
+
+class YouTubeCommand(BaseCommand):
+    """Command for YouTube transcript scraping and management."""
+    
+    # Subcommand name -> handler method, shared by all instances
+    _SUBCOMMANDS = {
+        "scrape": "_handle_scrape",
+        "stats": "_handle_stats",
+        "channels": "_handle_channels",
+        "video": "_handle_video",
+        "unprocessed": "_handle_unprocessed",
+        "mark-processed": "_handle_mark_processed",
+        "cache-stats": "_handle_cache_stats",
+        "cleanup": "_handle_cleanup",
+    }
+    
+    # Command metadata (constant, so plain class attributes)
+    name = "youtube"
+    description = "Manage YouTube transcript scraping and channel monitoring"
+    aliases = ("yt",)
+    usage = _YOUTUBE_USAGE
+    
+    @cached_property
+    def _youtube_service(self):
+        """The YouTube service, resolved once per command instance."""
+        # Imported here so loading the command (e.g. for --help) skips the YouTube stack
+        from src.time_reclamation.core.youtube import get_youtube_service
+        return get_youtube_service()
     
     def execute(self, args: List[str]) -> int:
         """
@@ -58,32 +119,25 @@ EXAMPLES:
             Exit code (0 for success, non-zero for error)
         """
         try:
-            if not args or args[0] in ["--help", "-h", "help"]:
+            if not args or args[0] in HELP_FLAGS:
                 self.show_help()
                 return 0
             
-            subcommand = args[0].lower()
             subcommand_args = args[1:] if len(args) > 1 else []
             
             # Route to appropriate subcommand
-            if subcommand == "scrape":
-                return self._handle_scrape(subcommand_args)
-            elif subcommand == "stats":
-                return self._handle_stats(subcommand_args)
-            elif subcommand == "channels":
-                return self._handle_channels(subcommand_args)
-            elif subcommand == "video":
-                return self._handle_video(subcommand_args)
-            elif subcommand == "unprocessed":
-                return self._handle_unprocessed(subcommand_args)
-            elif subcommand == "mark-processed":
-                return self._handle_mark_processed(subcommand_args)
-            elif subcommand == "cache-stats":
-                return self._handle_cache_stats(subcommand_args)
-            elif subcommand == "cleanup":
-                return self._handle_cleanup(subcommand_args)
-            else:
+            subcommand, handler = self.find_subcommand(args[0])
+            if handler is None:
                 return self.handle_error(f"Unknown subcommand: {subcommand}")
+            
+            if "--json" in subcommand_args:
+                if subcommand not in _JSON_SUBCOMMANDS:
+                    return self.handle_error(f"--json is not supported by the {subcommand} subcommand")
+                # Keep stdout machine-readable: only warnings and errors are logged
+                with self.logger.temporary_level("WARNING"):
+                    return handler(subcommand_args)
+            
+            return handler(subcommand_args)
                 
         except Exception as e:
             return self.handle_error(f"YouTube command failed: {str(e)}")
@@ -91,15 +145,15 @@ EXAMPLES:
     def _handle_scrape(self, args: List[str]) -> int:
         """Handle the scrape subcommand."""
         try:
-            youtube_service = get_youtube_service()
-            force_refresh = "--force" in args
+            youtube_service = self._youtube_service
             
-            if force_refresh:
-                args.remove("--force")
+            # Split off --force in one pass, leaving the caller's list untouched
+            positional = [arg for arg in args if arg != "--force"]
+            force_refresh = len(positional) != len(args)
             
-            if args:
+            if positional:
                 # Scrape specific channel
-                channel_name = args[0]
+                channel_name = positional[0]
                 self.logger.info(f"Scraping channel: {channel_name}")
                 
                 results = youtube_service.scrape_channel(channel_name, force_refresh)
@@ -107,15 +161,18 @@ EXAMPLES:
                 if 'error' in results:
                     return self.handle_error(results['error'])
                 
-                self.logger.print_header(f"Channel Scraping Results: {channel_name}")
-                self.logger.print_bullet(f"Videos found: {results['videos_found']}")
-                self.logger.print_bullet(f"New transcripts: {results['new_transcripts']}")
-                self.logger.print_bullet(f"Cached transcripts: {results['cached_transcripts']}")
+                with self.logger.buffered():
+                    self.logger.print_header(f"Channel Scraping Results: {channel_name}")
+                    self.logger.print_bullets((
+                        f"Videos found: {results['videos_found']}",
+                        f"New transcripts: {results['new_transcripts']}",
+                        f"Cached transcripts: {results['cached_transcripts']}",
+                    ))
                 
                 if results['errors']:
                     self.logger.print_section("ERRORS")
-                    for error in results['errors']:
-                        self.logger.error(f"  {error}")
+                    # One log record for all errors, one line each
+                    self.logger.error("%s", "\n".join(f"  {error}" for error in results['errors']))
                 
             else:
                 # Scrape all channels
@@ -126,22 +183,27 @@ EXAMPLES:
                 if 'error' in results:
                     return self.handle_error(results['error'])
                 
-                self.logger.print_header("All Channels Scraping Results")
-                self.logger.print_bullet(f"Channels processed: {results['processed_channels']}/{results['total_channels']}")
-                self.logger.print_bullet(f"Total videos found: {results['total_videos_found']}")
-                self.logger.print_bullet(f"New transcripts: {results['total_new_transcripts']}")
-                self.logger.print_bullet(f"Cached transcripts: {results['total_cached_transcripts']}")
-                self.logger.print_bullet(f"Total errors: {results['total_errors']}")
-                
-                # Show per-channel results
-                if results['channel_results']:
-                    self.logger.print_section("PER-CHANNEL RESULTS")
-                    for channel_result in results['channel_results']:
-                        self.logger.print_bullet(
-                            f"{channel_result['channel_name']}: "
-                            f"{channel_result['new_transcripts']} new, "
-                            f"{channel_result['cached_transcripts']} cached, "
-                            f"{len(channel_result['errors'])} errors"
+                with self.logger.buffered():
+                    self.logger.print_header("All Channels Scraping Results")
+                    self.logger.print_bullets((
+                        f"Channels processed: {results['processed_channels']}/{results['total_channels']}",
+                        f"Total videos found: {results['total_videos_found']}",
+                        f"New transcripts: {results['total_new_transcripts']}",
+                        f"Cached transcripts: {results['total_cached_transcripts']}",
+                        f"Total errors: {results['total_errors']}",
+                    ))
+                    
+                    # Show per-channel results
+                    if results['channel_results']:
+                        self.logger.print_section("PER-CHANNEL RESULTS")
+                        self.logger.print_bullets(
+                            _CHANNEL_SCRAPE_FORMAT % (
+                                channel_result['channel_name'],
+                                channel_result['new_transcripts'],
+                                channel_result['cached_transcripts'],
+                                len(channel_result['errors']),
+                            )
+                            for channel_result in results['channel_results']
                         )
             
             return self.handle_success("Scraping completed successfully")
@@ -152,45 +214,55 @@ EXAMPLES:
     def _handle_stats(self, args: List[str]) -> int:
         """Handle the stats subcommand."""
         try:
-            youtube_service = get_youtube_service()
+            youtube_service = self._youtube_service
             
-            # Get database stats
-            db_stats = youtube_service.get_database_stats()
+            # Database, channel and cache stats, gathered concurrently
+            stats = youtube_service.get_all_stats()
             
-            # Get channel stats
-            channel_stats = youtube_service.get_channel_stats()
+            if _split_json_flag(args)[1]:
+                _write_json(stats)
+                return 0
             
-            # Get cache stats
-            cache_stats = youtube_service.get_cache_stats()
+            db_stats = stats['database']
+            channel_stats = stats['channels']
+            cache_stats = stats['cache']
             
-            self.logger.print_header("YouTube Statistics")
-            
-            # Database statistics
-            self.logger.print_section("DATABASE STATISTICS")
-            self.logger.print_bullet(f"Total videos: {db_stats.get('total_videos', 0)}")
-            self.logger.print_bullet(f"Videos with transcripts: {db_stats.get('videos_with_transcripts', 0)}")
-            self.logger.print_bullet(f"LLM processed: {db_stats.get('llm_processed', 0)}")
-            self.logger.print_bullet(f"Unprocessed: {db_stats.get('unprocessed', 0)}")
-            self.logger.print_bullet(f"Unique channels: {db_stats.get('unique_channels', 0)}")
-            
-            # Cache statistics
-            self.logger.print_section("CACHE STATISTICS")
-            self.logger.print_bullet(f"Total cache files: {cache_stats.get('total_files', 0)}")
-            self.logger.print_bullet(f"Cache size: {cache_stats.get('total_size_mb', 0.0):.2f} MB")
-            self.logger.print_bullet(f"Cache directory: {cache_stats.get('cache_dir', 'N/A')}")
-            
-            # Channel statistics
-            if channel_stats:
-                self.logger.print_section("CHANNEL STATISTICS")
-                for channel in channel_stats:
-                    if 'error' not in channel:
-                        self.logger.print_bullet(
-                            f"{channel['name']}: {channel['total_videos']} videos, "
-                            f"{channel['videos_with_transcripts']} with transcripts, "
-                            f"{channel['cache_files']} cache files ({channel['cache_size_mb']:.2f} MB)"
+            with self.logger.buffered():
+                self.logger.print_header("YouTube Statistics")
+                
+                # Database statistics
+                self.logger.print_section("DATABASE STATISTICS")
+                self.logger.print_bullets((
+                    f"Total videos: {db_stats.get('total_videos', 0)}",
+                    f"Videos with transcripts: {db_stats.get('videos_with_transcripts', 0)}",
+                    f"LLM processed: {db_stats.get('llm_processed', 0)}",
+                    f"Unprocessed: {db_stats.get('unprocessed', 0)}",
+                    f"Unique channels: {db_stats.get('unique_channels', 0)}",
+                ))
+                
+                # Cache statistics
+                self.logger.print_section("CACHE STATISTICS")
+                self.logger.print_bullets((
+                    f"Total cache files: {cache_stats.get('total_files', 0)}",
+                    f"Cache size: {cache_stats.get('total_size_mb', 0.0):.2f} MB",
+                    f"Cache directory: {cache_stats.get('cache_dir', 'N/A')}",
+                ))
+                
+                # Channel statistics
+                if channel_stats:
+                    self.logger.print_section("CHANNEL STATISTICS")
+                    self.logger.print_bullets(
+                        _CHANNEL_STATS_FORMAT % (
+                            channel['name'],
+                            channel['total_videos'],
+                            channel['videos_with_transcripts'],
+                            channel['cache_files'],
+                            channel['cache_size_mb'],
                         )
-                    else:
-                        self.logger.print_bullet(f"{channel['name']}: Error - {channel['error']}")
+                        if 'error' not in channel else
+                        _CHANNEL_STATS_ERROR_FORMAT % (channel['name'], channel['error'])
+                        for channel in channel_stats
+                    )
             
             return self.handle_success()
             
@@ -200,22 +272,29 @@ EXAMPLES:
     def _handle_channels(self, args: List[str]) -> int:
         """Handle the channels subcommand."""
         try:
-            youtube_service = get_youtube_service()
+            youtube_service = self._youtube_service
             channels = youtube_service.get_channels()
             
+            if _split_json_flag(args)[1]:
+                _write_json([asdict(channel) for channel in channels])
+                return 0
+            
             if not channels:
                 self.logger.warning("No YouTube channels configured")
                 return 0
             
-            self.logger.print_header("Configured YouTube Channels")
-            
-            for channel in channels:
-                self.logger.print_section(channel.name)
-                self.logger.print_bullet(f"URL: {channel.url}")
-                self.logger.print_bullet(f"Scraping enabled: {'Yes' if channel.scrap else 'No'}")
-                self.logger.print_bullet(f"Max videos: {channel.max_videos}")
-                self.logger.print_bullet(f"Language: {channel.language}")
-                self.logger.print_bullet(f"Cache folder: {channel.cache_folder}")
+            with self.logger.buffered():
+                self.logger.print_header("Configured YouTube Channels")
+                
+                for channel in channels:
+                    self.logger.print_section(channel.name)
+                    self.logger.print_bullets((
+                        f"URL: {channel.url}",
+                        f"Scraping enabled: {'Yes' if channel.scrap else 'No'}",
+                        f"Max videos: {channel.max_videos}",
+                        f"Language: {channel.language}",
+                        f"Cache folder: {channel.cache_folder}",
+                    ))
             
             return self.handle_success()
             
@@ -231,7 +310,7 @@ EXAMPLES:
             video_url = args[0]
             language = args[1] if len(args) > 1 else 'en'
             
-            youtube_service = get_youtube_service()
+            youtube_service = self._youtube_service
             
             self.logger.info(f"Fetching transcript for: {video_url}")
             transcript_data = youtube_service.get_video_transcript(video_url, language)
@@ -245,22 +324,26 @@ EXAMPLES:
             
             metadata = transcript_data.get('metadata', {})
             
-            self.logger.print_header("Video Transcript")
-            self.logger.print_section("METADATA")
-            self.logger.print_bullet(f"Title: {metadata.get('title', 'N/A')}")
-            self.logger.print_bullet(f"Video ID: {metadata.get('video_id', 'N/A')}")
-            self.logger.print_bullet(f"Language: {metadata.get('language', 'N/A')}")
-            self.logger.print_bullet(f"Source: {metadata.get('source_type', 'N/A')}")
-            self.logger.print_bullet(f"Total entries: {metadata.get('total_entries', 0)}")
-            
-            # Show first few entries as preview
-            entries = transcript_data.get('entries', [])
-            if entries:
-                self.logger.print_section("TRANSCRIPT PREVIEW (First 3 entries)")
-                for i, entry in enumerate(entries[:3]):
-                    start_min = int(entry['start'] // 60)
-                    start_sec = int(entry['start'] % 60)
-                    self.logger.print_bullet(f"[{start_min:02d}:{start_sec:02d}] {entry['text']}")
+            with self.logger.buffered():
+                self.logger.print_header("Video Transcript")
+                self.logger.print_section("METADATA")
+                self.logger.print_bullets((
+                    f"Title: {metadata.get('title', 'N/A')}",
+                    f"Video ID: {metadata.get('video_id', 'N/A')}",
+                    f"Language: {metadata.get('language', 'N/A')}",
+                    f"Source: {metadata.get('source_type', 'N/A')}",
+                    f"Total entries: {metadata.get('total_entries', 0)}",
+                ))
+                
+                # Show first few entries as preview
+                entries = transcript_data.get('entries', [])
+                if entries:
+                    self.logger.print_section("TRANSCRIPT PREVIEW (First 3 entries)")
+                    preview_lines = []
+                    for entry in entries[:3]:
+                        start_min, start_sec = divmod(int(entry['start']), 60)
+                        preview_lines.append(f"[{start_min:02d}:{start_sec:02d}] {entry['text']}")
+                    self.logger.print_bullets(preview_lines)
             
             # Option to show full transcript
             if "--full" in args:
@@ -281,6 +364,7 @@ EXAMPLES:
     def _handle_unprocessed(self, args: List[str]) -> int:
         """Handle the unprocessed subcommand."""
         try:
+            args, json_output = _split_json_flag(args)
             limit = None
             if args:
                 try:
@@ -288,22 +372,44 @@ EXAMPLES:
                 except ValueError:
                     return self.handle_error("Limit must be a number")
             
-            youtube_service = get_youtube_service()
-            videos = youtube_service.get_unprocessed_videos(limit)
+            youtube_service = self._youtube_service
             
-            if not videos:
-                self.logger.info("No unprocessed videos found")
+            if json_output:
+                _write_json(list(youtube_service.iter_unprocessed_videos(limit)))
                 return 0
             
-            self.logger.print_header(f"Unprocessed Videos ({len(videos)})")
+            # Rows are streamed from the database and written in batches
+            videos = enumerate(youtube_service.iter_unprocessed_videos(limit), 1)
+            count = 0
+            
+            while True:
+                batch = list(islice(videos, _UNPROCESSED_BATCH_SIZE))
+                if not batch:
+                    break
+                
+                with self.logger.buffered():
+                    if not count:
+                        self.logger.print_header("Unprocessed Videos")
+                    
+                    for i, video in batch:
+                        self.logger.print_section(f"{i}. {video.get('title', 'Untitled')}")
+                        self.logger.print_bullets((
+                            f"URL: {video.get('url', 'N/A')}",
+                            f"Channel: {video.get('channel_name', 'N/A')}",
+                            f"Language: {video.get('language', 'N/A')}",
+                            f"Entries: {video.get('total_entries', 0)}",
+                            f"Created: {video.get('created_at', 'N/A')}",
+                        ))
+                
+                count += len(batch)
+            
+            if not count:
+                self.logger.info("No unprocessed videos found")
+                return 0
             
-            for i, video in enumerate(videos, 1):
-                self.logger.print_section(f"{i}. {video.get('title', 'Untitled')}")
-                self.logger.print_bullet(f"URL: {video.get('url', 'N/A')}")
-                self.logger.print_bullet(f"Channel: {video.get('channel_name', 'N/A')}")
-                self.logger.print_bullet(f"Language: {video.get('language', 'N/A')}")
-                self.logger.print_bullet(f"Entries: {video.get('total_entries', 0)}")
-                self.logger.print_bullet(f"Created: {video.get('created_at', 'N/A')}")
+            with self.logger.buffered():
+                self.logger.print_section("TOTAL")
+                self.logger.print_bullet(f"Unprocessed videos: {count}")
             
             return self.handle_success()
             
@@ -317,7 +423,7 @@ EXAMPLES:
                 return self.handle_error("Video URL is required")
             
             video_url = args[0]
-            youtube_service = get_youtube_service()
+            youtube_service = self._youtube_service
             
             success = youtube_service.mark_video_processed(video_url, True)
             
@@ -332,14 +438,21 @@ EXAMPLES:
     def _handle_cache_stats(self, args: List[str]) -> int:
         """Handle the cache-stats subcommand."""
         try:
-            youtube_service = get_youtube_service()
+            youtube_service = self._youtube_service
             cache_stats = youtube_service.get_cache_stats()
             
-            self.logger.print_header("Cache Statistics")
-            self.logger.print_bullet(f"Total files: {cache_stats.get('total_files', 0)}")
-            self.logger.print_bullet(f"Total size: {cache_stats.get('total_size_mb', 0.0):.2f} MB")
-            self.logger.print_bullet(f"Cache directory: {cache_stats.get('cache_dir', 'N/A')}")
-            self.logger.print_bullet(f"Directory exists: {'Yes' if cache_stats.get('exists', False) else 'No'}")
+            if _split_json_flag(args)[1]:
+                _write_json(cache_stats)
+                return 0
+            
+            with self.logger.buffered():
+                self.logger.print_header("Cache Statistics")
+                self.logger.print_bullets((
+                    f"Total files: {cache_stats.get('total_files', 0)}",
+                    f"Total size: {cache_stats.get('total_size_mb', 0.0):.2f} MB",
+                    f"Cache directory: {cache_stats.get('cache_dir', 'N/A')}",
+                    f"Directory exists: {'Yes' if cache_stats.get('exists', False) else 'No'}",
+                ))
             
             if 'error' in cache_stats:
                 self.logger.error(f"Cache error: {cache_stats['error']}")
@@ -352,7 +465,7 @@ EXAMPLES:
     def _handle_cleanup(self, args: List[str]) -> int:
         """Handle the cleanup subcommand."""
         try:
-            youtube_service = get_youtube_service()
+            youtube_service = self._youtube_service
             result = youtube_service.cleanup_cache()
             
             if result.get('success', False):
@@ -1,12 +1,19 @@
 """CLI Manager - Main entry point for command line interface."""
 
 import sys
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, Tuple
 from .command_pattern import CommandInvoker, CommandRegistry
 from src.time_reclamation.infrastructure import get_logger
+from src.time_reclamation.infrastructure.database import close_database_manager
 from src.time_reclamation.config import get_app_config
 
 
+# Command names handled directly by the CLI manager
+_VERSION_FLAGS = frozenset(("--version", "-v", "version"))
+_HELP_FLAGS = frozenset(("--help", "-h"))
+
+
 class CLIManager:
     """Main CLI manager that handles command line parsing and execution."""
     
@@ -18,12 +25,16 @@ class CLIManager:
             debug: Enable debug logging
         """
         self.logger = get_logger()
-        self.invoker = CommandInvoker()
         
         if debug:
             self.logger.set_level("DEBUG")
             self.logger.debug("Debug mode enabled")
     
+    @cached_property
+    def invoker(self) -> CommandInvoker:
+        """The command invoker, built on first use so --version never sets up the registry."""
+        return CommandInvoker()
+    
     def run(self, args: Optional[List[str]] = None) -> int:
         """
         Run the CLI with the given arguments.
@@ -42,59 +53,65 @@ class CLIManager:
             return self._show_default_help()
         
         # Parse arguments
-        command_name, command_args = self._parse_args(args)
+        command_name, command_args, debug = self._parse_args(args)
         
         # Handle global flags
-        if self._handle_global_flags(command_name, command_args):
+        if self._handle_global_flags(command_name, command_args, debug):
             return 0
         
-        # Execute the command
-        return self.invoker.execute_command(command_name, command_args)
+        # Execute the command, then release the cached database connection
+        try:
+            return self.invoker.execute_command(command_name, command_args)
+        finally:
+            close_database_manager()
     
-    def _parse_args(self, args: List[str]) -> tuple[str, List[str]]:
+    def _parse_args(self, args: List[str]) -> Tuple[str, List[str], bool]:
         """
         Parse command line arguments.
         
+        The global --debug flag is split off from the command arguments in
+        the same pass, without modifying the caller's list.
+        
         Args:
             args: Raw command line arguments
             
         Returns:
-            Tuple of (command_name, command_arguments)
+            Tuple of (command_name, command_arguments, debug)
         """
         if not args:
-            return "help", []
+            return "help", [], False
         
         command_name = args[0].lower()
-        command_args = args[1:] if len(args) > 1 else []
+        command_args = [arg for arg in args[1:] if arg != "--debug"]
+        debug = len(command_args) != len(args) - 1
         
-        return command_name, command_args
+        return command_name, command_args, debug
     
-    def _handle_global_flags(self, command_name: str, command_args: List[str]) -> bool:
+    def _handle_global_flags(self, command_name: str, command_args: List[str], debug: bool = False) -> bool:
         """
         Handle global flags that apply to the entire application.
         
         Args:
             command_name: The command name
-            command_args: Command arguments
+            command_args: Command arguments (without --debug)
+            debug: Whether --debug was given after the command name
             
         Returns:
             True if a global flag was handled, False otherwise
         """
         # Handle version flag
-        if command_name in ["--version", "-v", "version"]:
+        if command_name in _VERSION_FLAGS:
             self._show_version()
             return True
         
         # Handle global help flags
-        if command_name in ["--help", "-h"] or (not command_name and "--help" in command_args):
+        if command_name in _HELP_FLAGS or (not command_name and "--help" in command_args):
             return self._show_default_help() == 0
         
-        # Handle debug flag
-        if "--debug" in command_args:
+        # Handle debug flag (already removed from the command arguments)
+        if debug:
             self.logger.set_level("DEBUG")
             self.logger.debug("Debug mode enabled via --debug flag")
-            # Remove debug flag from args
-            command_args.remove("--debug")
         
         return False
     